@@ -1,58 +1,60 @@
 import tkinter as tk
 from tkinter import messagebox
-import joblib
-import numpy as np
+import os
+import pandas as pd
 
-# Load the saved model
-model = joblib.load('best_model.pkl')
+from artifact import load_model
+from features import model_features, FEATURE_FIELDS
+
+# Load the saved model: MODEL_PATH may be a .pkl or a pickle-free .artifact directory
+# (see artifact.py); by default pipeline.artifact, pipeline.pkl, then best_model.pkl
+model = load_model(os.environ.get('MODEL_PATH'))
+
+# Ask for exactly the columns the model was trained on: a fused pipeline
+# knows its own, a bare model takes app.py's form fields
+numeric_columns = getattr(model, 'numeric_columns', FEATURE_FIELDS[1:])
 
 def predict():
     try:
         # Get input values from entry widgets
-        followers = int(entry_followers.get())
-        following = int(entry_following.get())
-        posts = int(entry_posts.get())
-        bio_length = int(entry_bio_length.get())
-        username = 0  # Dummy value, we skipped username in input
+        values = {column: int(entry.get()) for column, entry in entries.items()}
+    except ValueError:
+        messagebox.showerror("Error", "Please enter valid numbers.")
+        return
 
-        # Prepare input data
-        input_data = np.array([[username, followers, following, posts, bio_length]])
+    try:
+        # Prepare input data (the fused pipeline scales and orders the raw columns itself)
+        input_data = model_features(model, pd.DataFrame([{'username': entry_username.get(), **values}]))
 
         # Predict
         prediction = model.predict(input_data)
+    except ValueError as e:
+        messagebox.showerror("Error", f"The model could not score this profile: {e}")
+        return
 
-        if prediction[0] == 1:
-            messagebox.showinfo("Result", "⚠️ Fake Profile Detected!")
-        else:
-            messagebox.showinfo("Result", "✅ Real Profile Detected!")
-
-    except ValueError:
-        messagebox.showerror("Error", "Please enter valid numbers.")
+    if prediction[0] == 1:
+        messagebox.showinfo("Result", "⚠️ Fake Profile Detected!")
+    else:
+        messagebox.showinfo("Result", "✅ Real Profile Detected!")
 
 # Create GUI window
 root = tk.Tk()
 root.title("Fake Profile Detection")
-root.geometry("300x300")
+root.geometry(f"300x{140 + 45 * len(numeric_columns)}")
 
 # Input fields
-tk.Label(root, text="Followers:").pack()
-entry_followers = tk.Entry(root)
-entry_followers.pack()
-
-tk.Label(root, text="Following:").pack()
-entry_following = tk.Entry(root)
-entry_following.pack()
-
-tk.Label(root, text="Posts:").pack()
-entry_posts = tk.Entry(root)
-entry_posts.pack()
+tk.Label(root, text="Username:").pack()
+entry_username = tk.Entry(root)
+entry_username.pack()
 
-tk.Label(root, text="Bio Length:").pack()
-entry_bio_length = tk.Entry(root)
-entry_bio_length.pack()
+entries = {}
+for column in numeric_columns:
+    tk.Label(root, text=f"{column.replace('_', ' ').capitalize()}:").pack()
+    entries[column] = tk.Entry(root)
+    entries[column].pack()
 
 # Predict button
 predict_button = tk.Button(root, text="Check Profile", command=predict)
 predict_button.pack(pady=10)
 
-root.mainloop()
\ No newline at end of file
+root.mainloop()
\ No newline at end of file
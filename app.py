@@ -1,11 +1,53 @@
-from flask import Flask, render_template, request
+from flask import Flask, render_template, request, Response, stream_with_context, jsonify, g
+import io
+import os
+import time
+from collections import deque
+from threading import Lock
 import numpy as np
-import joblib  # or pickle, depending on how you saved your model
+import pandas as pd
+
+from features import model_features, predict_scores
+from batcher import MicroBatcher
+from registry import ModelRegistry
+from ingest import read_profiles, parse_profiles, numeric_columns, invalid_rows
 
 app = Flask(__name__)
 
-# Load your trained model
-model = joblib.load('best_model.pkl')  # update this as needed
+# Load your trained model: MODEL_PATH may be a .pkl or a pickle-free .artifact directory
+# (see artifact.py); by default pipeline.artifact, pipeline.pkl, then best_model.pkl.
+# The registry polls it every MODEL_POLL_SECONDS (0 disables) and swaps in a
+# republished model without a restart; POST /admin/reload checks immediately.
+MODEL_PATH = os.environ.get('MODEL_PATH')
+registry = ModelRegistry(MODEL_PATH, poll_seconds=float(os.environ.get('MODEL_POLL_SECONDS', 2.0)))
+
+def current_model():
+    """The model snapshot this request uses from start to finish; its version is reported back"""
+    loaded = registry.current
+    g.model_version = loaded.version
+    return loaded.model
+
+@app.after_request
+def add_model_version(response):
+    if 'model_version' in g:
+        response.headers['X-Model-Version'] = g.model_version
+    return response
+
+# Rows scored per model call when processing uploaded CSV files
+UPLOAD_CHUNK_ROWS = 10000
+
+# Recent /api/predict batch timings (seconds) used for the p50/p99 report
+batch_timings = deque(maxlen=1000)
+batch_timings_lock = Lock()
+
+# Optional micro-batching of concurrent /predict calls (MICROBATCH=1 to enable)
+batcher = None
+if os.environ.get('MICROBATCH') == '1':
+    batcher = MicroBatcher(
+        registry.current.model,
+        max_batch_size=int(os.environ.get('MICROBATCH_MAX_BATCH', 64)),
+        max_wait_ms=float(os.environ.get('MICROBATCH_MAX_WAIT_MS', 2.0)),
+    )
 
 @app.route('/')
 def home():
@@ -13,6 +55,7 @@ def home():
 
 @app.route('/predict', methods=['POST'])
 def predict():
+    model = current_model()
     try:
         # Get form data
         username = request.form['username']
@@ -21,22 +64,142 @@ def predict():
         account_age_days = int(request.form['account_age_days'])
         posts_count = int(request.form['posts_count'])
 
-        # Feature extraction from username
-        username_length = len(username)
-
         # Prepare the features as an array
-        features = np.array([[username_length, num_followers, num_following, account_age_days, posts_count]])
+        features = model_features(model, pd.DataFrame([{
+            'username': username,
+            'num_followers': num_followers,
+            'num_following': num_following,
+            'account_age_days': account_age_days,
+            'posts_count': posts_count,
+        }]))
 
         # Make prediction
-        prediction = model.predict(features)[0]
+        if batcher is not None:
+            prediction = batcher.predict(features[0], model=model)
+        else:
+            prediction = model.predict(features)[0]
 
         # Convert prediction to human-readable text
         result = "Fake Profile 🚨" if prediction == 1 else "Genuine Profile ✅"
 
-        return render_template('index.html', prediction=result)
+        return render_template('index.html', prediction=result, model_version=g.model_version)
+
+    except Exception as e:
+        return render_template('index.html', prediction=f"Error: {str(e)}", model_version=g.model_version)
+
+@app.route('/upload', methods=['GET'])
+def upload_form():
+    return render_template('upload.html')
+
+@app.route('/upload', methods=['POST'])
+def upload():
+    uploaded = request.files.get('file')
+    if uploaded is None or uploaded.filename == '':
+        return "No file uploaded", 400
+
+    # The whole file is scored by the model that was current when the upload started
+    model = current_model()
+
+    # Take ownership of the upload so Flask does not close it while the response streams
+    stream, uploaded.stream = uploaded.stream, io.BytesIO()
+
+    def score(chunk):
+        # Rows with a bad number are echoed back unscored, with the reason in the error column
+        invalid = invalid_rows(chunk)
+        valid = chunk[~invalid]
+        predictions, scores = [], None
+        if len(valid):
+            # One vectorized model call per chunk instead of one per profile
+            predictions, scores = predict_scores(model, model_features(model, valid))
+        chunk['prediction'] = pd.Series(predictions, index=valid.index, dtype=object)
+        if hasattr(model, 'predict_proba'):
+            chunk['fake_probability'] = pd.Series(scores, index=valid.index, dtype=np.float64)
 
+        bad_cells = chunk.loc[invalid, numeric_columns(chunk)].isna()
+        chunk['error'] = ''
+        chunk.loc[invalid, 'error'] = [
+            'invalid ' + ', '.join(bad_cells.columns[row]) for row in bad_cells.to_numpy()
+        ]
+        return chunk
+
+    try:
+        # Read the upload lazily so only one chunk is held in memory at a time; extra
+        # columns are kept so they are echoed back in the result
+        reader = read_profiles(stream, chunksize=UPLOAD_CHUNK_ROWS, schema_only=False, keep_invalid=True)
+        first_chunk = score(next(reader))
+    except StopIteration:
+        stream.close()
+        return "Uploaded file is empty", 400
+    except ValueError as e:
+        stream.close()
+        return f"Error: {str(e)}", 400
+
+    def generate():
+        try:
+            yield first_chunk.to_csv(index=False)
+            for chunk in reader:
+                yield score(chunk).to_csv(index=False, header=False)
+        finally:
+            stream.close()
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/csv',
+        headers={'Content-Disposition': 'attachment; filename=predictions.csv'}
+    )
+
+@app.route('/metrics/batcher')
+def batcher_metrics():
+    if batcher is None:
+        return jsonify({'enabled': False})
+    return jsonify({'enabled': True, **batcher.stats()})
+
+@app.route('/api/predict', methods=['POST'])
+def api_predict():
+    model = current_model()
+    try:
+        profiles = parse_profiles(request.get_data(), request.content_type or '')
+        if not isinstance(profiles, list) or not profiles:
+            return jsonify({'error': 'Expected a non-empty list of profiles'}), 400
+
+        # One contiguous float32 matrix for the whole batch
+        features = model_features(model, pd.DataFrame.from_records(profiles), dtype=np.float32)
+
+        start = time.perf_counter()
+        predictions, scores = predict_scores(model, features)
+        elapsed = time.perf_counter() - start
+    except (ValueError, TypeError) as e:
+        return jsonify({'error': str(e)}), 400
+
+    with batch_timings_lock:
+        batch_timings.append(elapsed)
+        p50, p99 = np.percentile(batch_timings, [50, 99]) * 1000
+
+    return jsonify({
+        'predictions': predictions.tolist(),
+        'scores': None if scores is None else scores.tolist(),
+        'batch_size': len(profiles),
+        'batch_ms': elapsed * 1000,
+        'batch_ms_p50': p50,
+        'batch_ms_p99': p99,
+        'model_version': g.model_version,
+    })
+
+@app.route('/metrics/model')
+def model_metrics():
+    return jsonify(registry.status())
+
+@app.route('/admin/reload', methods=['POST'])
+def reload_model():
+    """Load the model file now instead of waiting for the next poll (?force=1 reloads even if unchanged)"""
+    previous = registry.current.version
+    try:
+        loaded = registry.reload(force=request.args.get('force') == '1')
     except Exception as e:
-        return render_template('index.html', prediction=f"Error: {str(e)}")
+        return jsonify({'error': str(e), 'version': previous}), 500
+    return jsonify({'version': loaded.version, 'previous_version': previous,
+                    'swapped': loaded.version != previous})
 
+# Development server only; serve wsgi.py with gunicorn in production
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    app.run(debug=True)
\ No newline at end of file
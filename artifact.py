@@ -0,0 +1,158 @@
+import json
+import os
+import time
+
+import numpy as np
+
+from scorer import LinearScorer, TreeEnsembleScorer, RBFScorer
+from pipeline import InferencePipeline
+
+# Pickle-free model artifact: a directory holding header.json plus one raw .npy
+# file per array. Arrays are memory-mapped read-only on load, so every worker
+# process serving the same artifact shares the same page-cache pages.
+#
+# Every save writes its arrays under a new version prefix and then atomically
+# replaces header.json, so a directory can be re-saved while it is being served:
+# readers see either the old or the new model, never a mix of the two.
+FORMAT_NAME = 'fake-profile-model'
+FORMAT_VERSION = 2
+HEADER_FILE = 'header.json'
+
+# Arrays and scalar parameters stored for each object kind
+LAYOUTS = {
+    'linear': (LinearScorer, ['coef', 'intercept', 'classes_'], []),
+    'tree_ensemble': (TreeEnsembleScorer,
+                      ['feature', 'threshold', 'left', 'right', 'value', 'roots', 'classes_',
+                       'input_mean', 'input_scale'],
+                      ['max_depth']),
+    'rbf': (RBFScorer, ['support_vectors', 'dual_coef', 'feature_weights', 'classes_'],
+            ['intercept', 'gamma']),
+    'pipeline': (InferencePipeline, [], ['numeric_columns', 'username_buckets', 'feature_names']),
+}
+KINDS = {cls: kind for kind, (cls, _, _) in LAYOUTS.items()}
+
+# Lookup order when no explicit model path is configured
+DEFAULT_MODEL_PATHS = ['pipeline.artifact', 'pipeline.pkl', 'best_model.pkl']
+
+# Array versions kept on disk; the previous one stays readable for loads that
+# read the old header just before it was replaced
+KEEP_VERSIONS = 2
+
+
+def to_plain_array(values):
+    """Object arrays cannot be memory-mapped, so store strings as fixed-width unicode"""
+    values = np.asarray(values)
+    if values.dtype == object:
+        values = values.astype(str) if len(values) else np.array([], dtype='<U1')
+    return values
+
+
+def describe(obj, directory, prefix):
+    kind = KINDS.get(type(obj))
+    if kind is None:
+        raise ValueError(f"Cannot store {type(obj).__name__} as an artifact")
+    _, arrays, params = LAYOUTS[kind]
+
+    entry = {'kind': kind, 'params': {}, 'arrays': {}}
+    for name in params:
+        value = getattr(obj, name)
+        entry['params'][name] = value.item() if isinstance(value, np.generic) else value
+    for name in arrays:
+        values = to_plain_array(getattr(obj, name))
+        filename = f"{prefix}{name}.npy"
+        np.save(os.path.join(directory, filename), np.ascontiguousarray(values))
+        entry['arrays'][name] = {'file': filename, 'dtype': values.dtype.str, 'shape': list(values.shape)}
+
+    if kind == 'pipeline':
+        entry['scorer'] = describe(obj.scorer, directory, prefix + 'scorer.')
+    return entry
+
+
+def array_version(filename):
+    """Numeric version of an array file written by save_artifact, -1 for unversioned files"""
+    prefix = filename.split('.', 1)[0]
+    return int(prefix[1:]) if prefix[:1] == 'v' and prefix[1:].isdigit() else -1
+
+
+def save_artifact(obj, directory):
+    """Write a scorer or fused pipeline as header.json plus raw .npy arrays
+
+    Returns the new model version, which is also recorded in the header.
+    """
+    os.makedirs(directory, exist_ok=True)
+    version = f"v{time.time_ns()}"
+    header = {'format': FORMAT_NAME, 'version': FORMAT_VERSION, 'model_version': version,
+              'model': describe(obj, directory, version + '.')}
+
+    # Write the header last (and atomically) so a half-written artifact is never loadable
+    tmp_path = os.path.join(directory, f"{HEADER_FILE}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(header, f, indent=2)
+    os.replace(tmp_path, os.path.join(directory, HEADER_FILE))
+
+    # Drop the arrays of older versions. Processes that still have them
+    # memory-mapped keep reading them; where the OS refuses to delete a mapped
+    # file, it is left for the next save to clean up.
+    arrays = [name for name in os.listdir(directory) if name.endswith('.npy')]
+    keep = sorted({array_version(name) for name in arrays})[-KEEP_VERSIONS:]
+    for name in arrays:
+        if array_version(name) not in keep:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+    return version
+
+
+def artifact_version(directory):
+    """Model version of the artifact currently published in directory"""
+    with open(os.path.join(directory, HEADER_FILE)) as f:
+        return json.load(f).get('model_version')
+
+
+def build(entry, directory, mmap_mode):
+    cls, _, _ = LAYOUTS[entry['kind']]
+
+    # Rebuild from stored state without re-running the constructors
+    obj = cls.__new__(cls)
+    for name, value in entry['params'].items():
+        setattr(obj, name, value)
+    for name, spec in entry['arrays'].items():
+        values = np.load(os.path.join(directory, spec['file']), mmap_mode=mmap_mode)
+        if list(values.shape) != spec['shape'] or values.dtype.str != spec['dtype']:
+            raise ValueError(f"Array {spec['file']} does not match the artifact header")
+        setattr(obj, name, values)
+
+    if entry['kind'] == 'pipeline':
+        obj.scorer = build(entry['scorer'], directory, mmap_mode)
+        obj.classes_ = obj.scorer.classes_
+    return obj
+
+
+def load_artifact(directory, mmap_mode='r'):
+    """Load an artifact written by save_artifact, memory-mapping its arrays"""
+    with open(os.path.join(directory, HEADER_FILE)) as f:
+        header = json.load(f)
+    if header.get('format') != FORMAT_NAME:
+        raise ValueError(f"{directory} is not a {FORMAT_NAME} artifact")
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported artifact version {header.get('version')} (expected {FORMAT_VERSION})")
+    return build(header['model'], directory, mmap_mode)
+
+
+def resolve_model_path(path=None):
+    """path itself, or the first of DEFAULT_MODEL_PATHS that exists when path is None"""
+    if path is None:
+        path = next((p for p in DEFAULT_MODEL_PATHS if os.path.exists(p)), DEFAULT_MODEL_PATHS[-1])
+    return path
+
+
+def load_model(path=None):
+    """Load a model artifact directory or a joblib pickle, trying DEFAULT_MODEL_PATHS when path is None"""
+    path = resolve_model_path(path)
+    if os.path.isdir(path):
+        return load_artifact(path)
+
+    # Imported here so artifact-only workers never load joblib/sklearn
+    import joblib
+    return joblib.load(path)
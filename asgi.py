@@ -0,0 +1,155 @@
+import asyncio
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from features import model_features, predict_scores
+from registry import ModelRegistry
+from ingest import parse_profiles
+
+# asyncio variant of app.py for many concurrent clients. Connections are
+# handled on the event loop, so a slow or idle client costs a coroutine
+# rather than a worker thread; only the CPU-bound parsing, feature building
+# and model calls run on a bounded thread pool. Same routes, inputs and
+# hot-reloading model registry as app.py:
+#
+#     pip install starlette uvicorn python-multipart
+#     uvicorn asgi:app --host 0.0.0.0 --port 8000 --workers 4
+
+MODEL_PATH = os.environ.get('MODEL_PATH')
+registry = ModelRegistry(MODEL_PATH, poll_seconds=float(os.environ.get('MODEL_POLL_SECONDS', 2.0)))
+
+# Threads running model calls, and how many more requests may wait for one;
+# beyond that the service answers 503 instead of queueing without bound
+PREDICT_THREADS = int(os.environ.get('PREDICT_THREADS', os.cpu_count() or 1))
+PREDICT_QUEUE = int(os.environ.get('PREDICT_QUEUE', 256))
+executor = ThreadPoolExecutor(PREDICT_THREADS, thread_name_prefix='predict')
+in_flight = 0
+
+# Recent /api/predict batch timings (seconds) used for the p50/p99 report
+batch_timings = deque(maxlen=1000)
+
+
+class Overloaded(Exception):
+    pass
+
+
+async def run_cpu(function, *args):
+    """Run function on the predict pool, failing fast when the pool's backlog is full"""
+    global in_flight
+    if in_flight >= PREDICT_THREADS + PREDICT_QUEUE:
+        raise Overloaded()
+    in_flight += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+    finally:
+        in_flight -= 1
+
+
+def respond(content, loaded, status_code=200):
+    return JSONResponse(content, status_code=status_code, headers={'X-Model-Version': loaded.version})
+
+
+async def read_profile(request):
+    """One profile from a form post (like app.py's /predict) or a JSON object"""
+    if request.headers.get('content-type', '').startswith('application/json'):
+        profile = await request.json()
+        if not isinstance(profile, dict):
+            raise ValueError('Expected a JSON object')
+        return profile
+    return dict(await request.form())
+
+
+def predict_one(model, profile):
+    features = model_features(model, pd.DataFrame([profile]))
+    return model.predict(features)[0]
+
+
+async def predict(request):
+    loaded = registry.current
+    try:
+        profile = await read_profile(request)
+        prediction = await run_cpu(predict_one, loaded.model, profile)
+    except Overloaded:
+        return respond({'error': 'Too many requests in progress'}, loaded, 503)
+    except (ValueError, TypeError) as e:
+        return respond({'error': str(e)}, loaded, 400)
+
+    # Convert prediction to human-readable text
+    result = "Fake Profile 🚨" if prediction == 1 else "Genuine Profile ✅"
+    return respond({'prediction': result, 'label': prediction.item(), 'model_version': loaded.version}, loaded)
+
+
+def predict_batch(model, body, content_type):
+    profiles = parse_profiles(body, content_type)
+    if not isinstance(profiles, list) or not profiles:
+        raise ValueError('Expected a non-empty list of profiles')
+
+    # One contiguous float32 matrix for the whole batch
+    features = model_features(model, pd.DataFrame.from_records(profiles), dtype=np.float32)
+    start = time.perf_counter()
+    predictions, scores = predict_scores(model, features)
+    elapsed = time.perf_counter() - start
+    return predictions.tolist(), None if scores is None else scores.tolist(), elapsed
+
+
+async def api_predict(request):
+    loaded = registry.current
+    try:
+        body = await request.body()
+        predictions, scores, elapsed = await run_cpu(
+            predict_batch, loaded.model, body, request.headers.get('content-type', '')
+        )
+    except Overloaded:
+        return respond({'error': 'Too many requests in progress'}, loaded, 503)
+    except (ValueError, TypeError) as e:
+        return respond({'error': str(e)}, loaded, 400)
+
+    batch_timings.append(elapsed)
+    p50, p99 = np.percentile(batch_timings, [50, 99]) * 1000
+    return respond({
+        'predictions': predictions,
+        'scores': scores,
+        'batch_size': len(predictions),
+        'batch_ms': elapsed * 1000,
+        'batch_ms_p50': p50,
+        'batch_ms_p99': p99,
+        'model_version': loaded.version,
+    }, loaded)
+
+
+async def model_metrics(request):
+    return JSONResponse({**registry.status(), 'predict_threads': PREDICT_THREADS,
+                         'predict_queue': PREDICT_QUEUE, 'in_flight': in_flight})
+
+
+async def reload_model(request):
+    """Load the model file now instead of waiting for the next poll (?force=1 reloads even if unchanged)"""
+    previous = registry.current.version
+    force = request.query_params.get('force') == '1'
+    try:
+        # Loading runs on the default pool, not the predict threads
+        loaded = await asyncio.get_running_loop().run_in_executor(None, registry.reload, force)
+    except Exception as e:
+        return JSONResponse({'error': str(e), 'version': previous}, status_code=500)
+    return JSONResponse({'version': loaded.version, 'previous_version': previous,
+                         'swapped': loaded.version != previous})
+
+
+app = Starlette(routes=[
+    Route('/predict', predict, methods=['POST']),
+    Route('/api/predict', api_predict, methods=['POST']),
+    Route('/metrics/model', model_metrics),
+    Route('/admin/reload', reload_model, methods=['POST']),
+])
+
+if __name__ == '__main__':
+    import uvicorn
+    uvicorn.run(app, host=os.environ.get('HOST', '127.0.0.1'), port=int(os.environ.get('PORT', 8000)))
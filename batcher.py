@@ -0,0 +1,117 @@
+import os
+import queue
+import time
+from bisect import bisect_left
+from concurrent.futures import Future
+from threading import Lock, Thread
+
+import numpy as np
+
+
+class MicroBatcher:
+    """Coalesce single-row predictions from concurrent requests into one model call
+
+    Rows submitted within max_wait_ms of the first queued row (or until
+    max_batch_size rows are waiting) are stacked and scored together, and each
+    caller gets its own result back through a Future.
+    """
+
+    def __init__(self, model, max_batch_size=64, max_wait_ms=2.0):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.queue = queue.Queue()
+
+        # Batch-size histogram buckets: 1, 2, 4, ... up to max_batch_size
+        self.bucket_bounds = [1]
+        while self.bucket_bounds[-1] < max_batch_size:
+            self.bucket_bounds.append(min(self.bucket_bounds[-1] * 2, max_batch_size))
+        self.bucket_counts = [0] * len(self.bucket_bounds)
+        self.batches = 0
+        self.rows = 0
+        self.stats_lock = Lock()
+
+        self.start()
+        if hasattr(os, 'register_at_fork'):
+            # Restart the worker thread in processes forked after the batcher was created
+            os.register_at_fork(after_in_child=self.after_fork)
+
+    def start(self):
+        self.worker = Thread(target=self.run, daemon=True)
+        self.worker.start()
+
+    def after_fork(self):
+        self.queue = queue.Queue()
+        self.stats_lock = Lock()
+        self.start()
+
+    def submit(self, row, model=None):
+        """Queue one feature row and return a Future resolving to its prediction
+
+        model overrides self.model for this row, e.g. the snapshot a request
+        built its features for while a reloaded model is being swapped in.
+        """
+        future = Future()
+        self.queue.put((np.asarray(row), future, self.model if model is None else model))
+        return future
+
+    def predict(self, row, timeout=None, model=None):
+        return self.submit(row, model).result(timeout)
+
+    def collect(self):
+        """Block for the first row, then gather more until the batch is full or the window closes"""
+        batch = [self.queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def run(self):
+        while True:
+            batch = self.collect()
+
+            # One model call per model in the batch (normally just one)
+            groups = {}
+            for row, future, model in batch:
+                groups.setdefault(id(model), (model, [], []))
+                groups[id(model)][1].append(row)
+                groups[id(model)][2].append(future)
+
+            for model, rows, futures in groups.values():
+                try:
+                    predictions = model.predict(np.vstack(rows))
+                except Exception as e:
+                    for future in futures:
+                        future.set_exception(e)
+                else:
+                    for future, prediction in zip(futures, predictions):
+                        future.set_result(prediction)
+            self.record(len(batch))
+
+    def record(self, batch_size):
+        with self.stats_lock:
+            self.batches += 1
+            self.rows += batch_size
+            self.bucket_counts[bisect_left(self.bucket_bounds, batch_size)] += 1
+
+    def stats(self):
+        """Queue depth and batch-size histogram for monitoring"""
+        with self.stats_lock:
+            return {
+                'queue_depth': self.queue.qsize(),
+                'batches': self.batches,
+                'rows': self.rows,
+                'mean_batch_size': self.rows / self.batches if self.batches else 0.0,
+                'batch_size_histogram': [
+                    {'le': bound, 'count': count}
+                    for bound, count in zip(self.bucket_bounds, self.bucket_counts)
+                ],
+                'max_batch_size': self.max_batch_size,
+                'max_wait_ms': self.max_wait * 1000,
+            }
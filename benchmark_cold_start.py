@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import tempfile
+import os
+
+import joblib
+
+from artifact import save_artifact
+from scorer import export_scorer
+
+# Measures, in a fresh interpreter each time, how long it takes to import the
+# loader and get a model ready to score (interpreter startup is excluded).
+LOADERS = {
+    'joblib best_model.pkl': "import joblib; model = joblib.load({path!r})",
+    'artifact (mmap)': "from artifact import load_artifact; model = load_artifact({path!r})",
+}
+TIMER = (
+    "import time; start = time.perf_counter(); {load}; "
+    "model.predict([{row}]); "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+
+def cold_start_ms(load, row, runs=5):
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-W', 'ignore', '-c', TIMER.format(load=load, row=row)],
+                                capture_output=True, text=True, check=True).stdout
+        timings.append(float(output.strip()))
+    return min(timings), sorted(timings)[len(timings) // 2]
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    artifact_path = os.path.join(tmp, 'best_model.artifact')
+    model = joblib.load('best_model.pkl')
+    save_artifact(export_scorer(model), artifact_path)
+    # One row as wide as the model's input, whichever feature layout it was trained on
+    row = [1.0] * model.n_features_in_
+
+    paths = {'joblib best_model.pkl': 'best_model.pkl', 'artifact (mmap)': artifact_path}
+    print(f"{'Loader':<24}{'best ms':>10}{'median ms':>12}")
+    for name, load in LOADERS.items():
+        best, median = cold_start_ms(load.format(path=paths[name]), row)
+        print(f"{name:<24}{best:>10.1f}{median:>12.1f}")
@@ -0,0 +1,187 @@
+import argparse
+import asyncio
+import gzip
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tests import AdvancedFakeProfileDetector
+from async_fetch import AsyncProfileFetcher
+from http_pool import PooledSession
+
+# Compares the blocking fetch_*_data methods (one at a time and on a thread
+# pool) with AsyncProfileFetcher, against a local stub server that answers
+# every request with a saved profile page after a configurable delay, so the
+# numbers reflect the fetch engine rather than the real platforms.
+#
+#     python benchmark_fetch.py --requests 2000 --latency-ms 100 --concurrency 500
+
+parser = argparse.ArgumentParser(description="Benchmark sync vs asyncio profile fetching against a stub server")
+parser.add_argument('--requests', type=int, default=1000, help="profiles fetched per engine")
+parser.add_argument('--latency-ms', type=float, default=100.0, help="stub server delay per response")
+parser.add_argument('--jitter-ms', type=float, default=20.0, help="uniform +/- jitter on the delay")
+parser.add_argument('--concurrency', type=int, default=500, help="in-flight fetches for the async engine")
+parser.add_argument('--threads', type=int, default=32, help="worker threads for the thread-pool engine")
+parser.add_argument('--sequential', type=int, default=20,
+                    help="profiles fetched one at a time for the sequential baseline")
+parser.add_argument('--pages', default=None,
+                    help="directory of saved profile pages (<platform>.html); built-in samples otherwise")
+
+# Minimal pages that the detector's parsers fully understand
+SAMPLE_PAGES = {
+    'twitter': """<html><head><title>stub_user</title>
+<script type="application/ld+json">{"@type": "Person", "dateCreated": "2019-03-01T10:00:00+00:00"}</script>
+</head><body>
+<a href="/stub_user/statuses">1,234 Posts</a>
+<a href="/stub_user/followers">567 Followers</a>
+<a href="/stub_user/following">89 Following</a>
+<img alt="stub_user" src="https://pbs.example.com/profile_images/1/photo.jpg">
+<div data-testid="UserName">stub_user</div>
+</body></html>""",
+    'linkedin': """<html><head>
+<script type="application/ld+json">{"@type": "Person", "name": "Stub User", "image": "https://media.example.com/p.jpg", "description": "Engineer"}</script>
+</head><body></body></html>""",
+    'facebook': """<html><head><title>Stub User</title></head>
+<body><img alt="Stub User profile picture" src="https://scontent.example.com/p.jpg"></body></html>""",
+}
+
+
+def load_pages(directory):
+    pages = dict(SAMPLE_PAGES)
+    if directory:
+        for filename in os.listdir(directory):
+            platform, ext = os.path.splitext(filename)
+            if ext == '.html':
+                with open(os.path.join(directory, filename), encoding='utf-8') as f:
+                    pages[platform] = f.read()
+    return {platform: page.encode('utf-8') for platform, page in pages.items()}
+
+
+class StubServer:
+    """Keep-alive HTTP/1.1 server on its own thread; GET /<platform>/<name> returns the saved page"""
+
+    def __init__(self, pages, latency, jitter):
+        self.pages = pages
+        self.gzipped = {platform: gzip.compress(page) for platform, page in pages.items()}
+        self.latency = latency
+        self.jitter = jitter
+        self.loop = asyncio.new_event_loop()
+        self.handlers = set()  # one task per open client connection
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        self.ready.wait()
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        self.server = self.loop.run_until_complete(
+            asyncio.start_server(self.handle, '127.0.0.1', 0, backlog=4096)
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.ready.set()
+        self.loop.run_forever()
+
+    async def handle(self, reader, writer):
+        self.handlers.add(asyncio.current_task())
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                accepts_gzip = False
+                while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    name, _, value = line.partition(b':')
+                    if name.strip().lower() == b'accept-encoding' and b'gzip' in value:
+                        accepts_gzip = True
+
+                await asyncio.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+                platform = request_line.split()[1].decode().strip('/').split('/')[0]
+                body = (self.gzipped if accepts_gzip else self.pages).get(platform)
+                status = b'200 OK' if body is not None else b'404 Not Found'
+                headers = b'Content-Type: text/html; charset=utf-8\r\n'
+                if body is not None and accepts_gzip:
+                    headers += b'Content-Encoding: gzip\r\n'
+                body = body or b''
+                writer.write(b'HTTP/1.1 ' + status + b'\r\n' + headers +
+                             b'Content-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body)
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+            self.handlers.discard(asyncio.current_task())
+
+    def url(self, platform, name):
+        return f"http://127.0.0.1:{self.port}/{platform}/{name}"
+
+    def stop(self):
+        """Close the listener and every client connection, then stop the loop and its thread"""
+        asyncio.run_coroutine_threadsafe(self.shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    async def shutdown(self):
+        self.server.close()
+        handlers = list(self.handlers)
+        for task in handlers:
+            task.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        await self.server.wait_closed()
+
+
+def report(name, count, seconds, results):
+    parsed = sum(result is not None for result in results)
+    print(f"{name:<22}{count:>8}{seconds:>10.2f}{count / seconds:>12.1f}{parsed:>10}")
+
+
+async def run_async(detector, urls, platform, concurrency):
+    results = [None] * len(urls)
+    async with AsyncProfileFetcher(detector, max_connections=concurrency) as fetcher:
+        async for index, data in fetcher.fetch_profiles(urls, platform, max_in_flight=concurrency):
+            results[index] = data
+    return results
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    pages = load_pages(args.pages)
+    server = StubServer(pages, args.latency_ms / 1000, args.jitter_ms / 1000)
+    # Only the fetchers and parsers are exercised, so no name pattern or indicator files are needed
+    detector = AdvancedFakeProfileDetector(fake_name_patterns={}, fake_indicators={})
+    # One pooled connection per thread, so the per-host cap does not throttle the thread pool
+    detector.http = PooledSession(headers=detector.headers, per_host_connections=args.threads)
+
+    platform = 'twitter' if 'twitter' in pages else next(iter(pages))
+    urls = [server.url(platform, f"user{i}") for i in range(args.requests)]
+    fetch = getattr(detector, f"fetch_{platform}_data")
+    print(f"Stub server on port {server.port}: {platform} pages, "
+          f"{args.latency_ms:.0f} ± {args.jitter_ms:.0f} ms per response\n")
+    print(f"{'engine':<22}{'fetches':>8}{'seconds':>10}{'fetches/s':>12}{'parsed':>10}")
+
+    # Sequential baseline: what analyze_profile does today, one URL at a time
+    start = time.perf_counter()
+    sequential = [fetch(url) for url in urls[:args.sequential]]
+    report('sequential (sync)', len(sequential), time.perf_counter() - start, sequential)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.threads) as pool:
+        threaded = list(pool.map(fetch, urls))
+    report(f'thread pool ({args.threads})', len(urls), time.perf_counter() - start, threaded)
+    pooled_stats = detector.http.report()
+
+    start = time.perf_counter()
+    async_results = asyncio.run(run_async(detector, urls, platform, args.concurrency))
+    report(f'asyncio ({args.concurrency})', len(urls), time.perf_counter() - start, async_results)
+
+    # Same return contract: the async engine must produce exactly what the sync methods do
+    print(f"\nAsync results identical to sync: {async_results == threaded}")
+
+    # Connection reuse of the detector's pooled session over the sync runs
+    for host, stats in pooled_stats.items():
+        print(f"Pooled session, {host}: {stats['requests']} requests over {stats['connections']} connections "
+              f"(reuse {stats['reuse_rate']:.1%}), {stats['compressed']} compressed, "
+              f"TTFB p50 {stats['ttfb_ms_p50']:.1f} ms, p95 {stats['ttfb_ms_p95']:.1f} ms")
+    server.stop()
@@ -0,0 +1,85 @@
+import argparse
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from sklearn.base import clone
+from sklearn.preprocessing import StandardScaler
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.svm import SVC
+
+from features import build_feature_matrix, model_frame, USERNAME_BUCKETS
+from ingest import read_profiles
+from scorer import export_scorer
+from pipeline import build_pipeline
+
+parser = argparse.ArgumentParser(description="Check and time the NumPy scorers against sklearn")
+parser.add_argument('--csv', default='fake_profiles.csv',
+                    help="labelled profiles for the served-pipeline check, e.g. create_dataset.py "
+                         "--distribution realistic output")
+args = parser.parse_args()
+
+# Step 1: Build serving feature matrices. The saved y splits hold a single
+# class, so the candidate families are fitted on fake_profiles.csv instead.
+df = read_profiles('fake_profiles.csv').rename(columns={'account_age': 'account_age_days'})
+X_train = build_feature_matrix(df)
+y_train = df['label']
+X_test = build_feature_matrix(pd.read_csv('X_test.csv'))
+
+models = {
+    "best_model.pkl": joblib.load('best_model.pkl'),
+    "Logistic Regression": LogisticRegression(max_iter=1000),
+    "Decision Tree": DecisionTreeClassifier(max_depth=5),
+    "Random Forest": RandomForestClassifier(n_estimators=100, max_depth=5),
+    "SVM": SVC(kernel='rbf', C=1.0, gamma='scale')
+}
+
+
+def per_row_latency(predict, X, repeats=3):
+    """Best-of-N mean time (microseconds) to score X one row at a time"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for i in range(len(X)):
+            predict(X[i:i + 1])
+        best = min(best, (time.perf_counter() - start) / len(X))
+    return best * 1e6
+
+
+# Step 2: Export every model family, check predictions and time single-row scoring
+print(f"{'Model':<22}{'match':>8}{'sklearn µs/row':>17}{'scorer µs/row':>16}{'speedup':>10}")
+for name, model in models.items():
+    if name != "best_model.pkl":
+        model.fit(X_train, y_train)
+    scorer = export_scorer(model)
+
+    match = np.array_equal(model.predict(X_test), scorer.predict(X_test))
+    sklearn_us = per_row_latency(model.predict, X_test)
+    scorer_us = per_row_latency(scorer.predict, X_test)
+
+    print(f"{name:<22}{str(match):>8}{sklearn_us:>17.1f}{scorer_us:>16.1f}{sklearn_us / scorer_us:>9.1f}x")
+
+
+# Step 3: Check what is actually served: the fused pipeline from build_pipeline,
+# with the scaler folded in, scoring raw profile columns, against sklearn on the
+# scaled username-feature matrix model.py trains on
+profiles = read_profiles(args.csv)
+labels = profiles.pop('label')
+numeric_columns = [column for column in profiles.columns if column != 'username']
+scaler = StandardScaler().fit(model_frame(profiles, numeric_columns))
+X_scaled = scaler.transform(model_frame(profiles, numeric_columns))
+train = np.arange(len(profiles)) % 5 != 0
+
+print(f"\nServed pipeline vs sklearn on {args.csv} ({(~train).sum()} held-out rows)")
+print(f"{'Model':<22}{'mismatches':>12}")
+for name, model in models.items():
+    if name == "best_model.pkl":
+        continue  # trained on a different feature layout
+    fitted = clone(model).fit(X_scaled[train], labels[train])
+    pipeline = build_pipeline(numeric_columns, scaler, fitted, username_buckets=USERNAME_BUCKETS)
+    mismatches = int((fitted.predict(X_scaled[~train]) != pipeline.predict(profiles[~train])).sum())
+    print(f"{name:<22}{mismatches:>12}")
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import joblib
+
+from artifact import save_artifact, KINDS
+from scorer import export_scorer
+
+# Usage: python convert_artifact.py [best_model.pkl] [best_model.artifact]
+source = sys.argv[1] if len(sys.argv) > 1 else 'best_model.pkl'
+target = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(source)[0] + '.artifact'
+
+model = joblib.load(source)
+
+# Plain sklearn estimators are exported to a NumPy scorer first
+if type(model) not in KINDS:
+    model = export_scorer(model)
+
+save_artifact(model, target)
+print(f"✅ Artifact written: {type(model).__name__} ({target})")
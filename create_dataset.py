@@ -1,40 +1,160 @@
+import argparse
+import os
+
 import pandas as pd
 import numpy as np
+from joblib import Parallel, delayed
+
+parser = argparse.ArgumentParser(description="Generate a synthetic fake/real profile dataset")
+parser.add_argument('--rows', type=int, default=1000, help="total profiles to generate")
+parser.add_argument('--fake-fraction', type=float, default=0.5, help="share of fake profiles")
+parser.add_argument('--shards', type=int, default=1, help="output files, generated in parallel")
+parser.add_argument('--jobs', type=int, default=-1, help="worker processes (-1 = all cores)")
+parser.add_argument('--batch-rows', type=int, default=1_000_000,
+                    help="rows generated and written at a time; bounds memory per worker")
+parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+parser.add_argument('--distribution', choices=['uniform', 'realistic'], default='uniform',
+                    help="uniform: disjoint per-class ranges (the original data); realistic: heavy-tailed, "
+                         "correlated features with overlapping classes")
+parser.add_argument('--overlap', type=float, default=0.3,
+                    help="realistic only: 0 keeps the class distributions apart, 1 makes fakes "
+                         "statistically identical to real profiles")
+parser.add_argument('--seed', type=int, default=42,
+                    help="base seed; each shard gets its own child seed, so output is reproducible "
+                         "for the same --seed, --rows, --shards and --batch-rows")
+parser.add_argument('--output', default='fake_profiles.csv',
+                    help="output file; with several shards, <stem>-00000-of-00008<ext> files are written")
+
+
+def generate_batch(rng, start, n, fake_fraction):
+    """n profiles with global row ids start..start+n-1, real and fake already interleaved"""
+    is_fake = rng.random(n) < fake_fraction
+
+    # Draw both classes' values and keep the right one per row, so no per-class
+    # frames need to be concatenated and shuffled afterwards
+    def draw(real_range, fake_range):
+        return np.where(is_fake, rng.integers(*fake_range, n), rng.integers(*real_range, n))
+
+    ids = np.arange(start, start + n).astype(str)
+    prefixes = np.where(is_fake, 'user_fake_', 'user_real_')
+
+    return pd.DataFrame({
+        'username': np.char.add(prefixes, ids),
+        'followers': draw((300, 10000), (0, 500)),
+        'following': draw((100, 3000), (500, 5000)),
+        'posts': draw((50, 500), (0, 50)),
+        'bio_length': draw((50, 300), (5, 100)),
+        'label': is_fake.astype(np.uint8),
+    })
+
+
+# Username building blocks for the realistic generator; the label is not encoded in the name
+SYLLABLES = np.array(['al', 'an', 'ar', 'be', 'ca', 'da', 'el', 'en', 'fi', 'ga', 'ha', 'is',
+                      'jo', 'ka', 'le', 'ma', 'ni', 'or', 'pa', 'ri', 'sa', 'ta', 'us', 'vi'])
+
+
+def realistic_batch(rng, n, fake_fraction, overlap):
+    """n profiles with heavy-tailed counts, correlated activity and overlapping classes
+
+    Real accounts are older, post in proportion to their age and gain
+    followers with activity; fake accounts are young, follow many and are
+    followed by few. overlap interpolates the fake parameters toward the real
+    ones, so models cannot separate the classes perfectly.
+    """
+    is_fake = rng.random(n) < fake_fraction
+
+    def param(real, fake):
+        return np.where(is_fake, fake + overlap * (real - fake), real)
+
+    # Account age in days: log-normal, fakes much younger
+    age_days = np.maximum(rng.lognormal(param(6.8, 4.0), param(0.8, 1.0)), 1).astype(np.int64)
+
+    # Posts grow with age at a per-account log-normal activity rate
+    rate = rng.lognormal(param(-1.5, -3.0), 1.0)
+    posts = rng.poisson(rate * age_days)
+
+    # Followers: heavy-tailed (log-normal), boosted by activity; following capped at 7500
+    followers = rng.lognormal(param(5.5, 2.5) + 0.3 * np.log1p(posts), param(1.5, 1.2)).astype(np.int64)
+    following = np.minimum(rng.lognormal(param(5.8, 7.0), param(1.0, 0.8)), 7500).astype(np.int64)
+
+    # Bios: fakes are more often empty
+    has_bio = rng.random(n) > param(0.2, 0.6)
+    bio_length = np.where(has_bio, rng.integers(10, 160, n), 0)
+
+    # Usernames: two syllables, fakes more likely to carry a long digit suffix
+    names = np.char.add(SYLLABLES[rng.integers(0, len(SYLLABLES), n)],
+                        SYLLABLES[rng.integers(0, len(SYLLABLES), n)])
+    digits = rng.integers(0, 10 ** rng.integers(2, 7, n), dtype=np.int64).astype(str)
+    with_digits = rng.random(n) < param(0.3, 0.8)
+    usernames = np.where(with_digits, np.char.add(names, digits), names)
+
+    return pd.DataFrame({
+        'username': usernames,
+        'followers': followers,
+        'following': following,
+        'posts': posts,
+        'bio_length': bio_length,
+        'account_age_days': age_days,
+        'label': is_fake.astype(np.uint8),
+    })
+
+
+def shard_path(output, shard, shards):
+    if shards == 1:
+        return output
+    stem, ext = os.path.splitext(output)
+    return f"{stem}-{shard:05d}-of-{shards:05d}{ext}"
+
+
+def write_shard(path, seed_sequence, start, rows, args):
+    """Generate one shard batch by batch, appending each batch to the output file"""
+    rng = np.random.default_rng(seed_sequence)
+    writer = None
+    for offset in range(0, rows, args.batch_rows):
+        n = min(args.batch_rows, rows - offset)
+        if args.distribution == 'realistic':
+            batch = realistic_batch(rng, n, args.fake_fraction, args.overlap)
+        else:
+            batch = generate_batch(rng, start + offset, n, args.fake_fraction)
+        if args.format == 'parquet':
+            # Imported here so CSV output does not require pyarrow
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(batch, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+        else:
+            batch.to_csv(path, index=False, mode='w' if offset == 0 else 'a', header=offset == 0)
+    if writer is not None:
+        writer.close()
+    return path
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    if args.shards < 1 or args.rows < args.shards:
+        # Every shard must get at least one row, or its file would never be written
+        parser.error(f"--rows ({args.rows}) must be at least --shards ({args.shards}), which must be positive")
+    if args.batch_rows < 1:
+        parser.error(f"--batch-rows ({args.batch_rows}) must be positive")
+
+    if os.path.dirname(args.output):
+        os.makedirs(os.path.dirname(args.output), exist_ok=True)
+
+    # Independent, reproducible stream per shard regardless of how many workers run them
+    seeds = np.random.SeedSequence(args.seed).spawn(args.shards)
+    bounds = np.linspace(0, args.rows, args.shards + 1).astype(np.int64)
+
+    paths = Parallel(n_jobs=min(args.jobs if args.jobs > 0 else os.cpu_count(), args.shards))(
+        delayed(write_shard)(shard_path(args.output, shard, args.shards), seeds[shard],
+                             int(bounds[shard]), int(bounds[shard + 1] - bounds[shard]), args)
+        for shard in range(args.shards)
+    )
 
-# Set random seed for reproducibility
-np.random.seed(42)
-
-# Number of samples
-num_real = 500
-num_fake = 500
-
-# Generate real profiles
-real_profiles = {
-    'username': ['user_real_' + str(i) for i in range(num_real)],
-    'followers': np.random.randint(300, 10000, num_real),
-    'following': np.random.randint(100, 3000, num_real),
-    'posts': np.random.randint(50, 500, num_real),
-    'bio_length': np.random.randint(50, 300, num_real),
-    'label': [0] * num_real
-}
-
-# Generate fake profiles
-fake_profiles = {
-    'username': ['user_fake_' + str(i) for i in range(num_fake)],
-    'followers': np.random.randint(0, 500, num_fake),
-    'following': np.random.randint(500, 5000, num_fake),
-    'posts': np.random.randint(0, 50, num_fake),
-    'bio_length': np.random.randint(5, 100, num_fake),
-    'label': [1] * num_fake
-}
-
-# Combine into one DataFrame
-df_real = pd.DataFrame(real_profiles)
-df_fake = pd.DataFrame(fake_profiles)
-df = pd.concat([df_real, df_fake]).sample(frac=1).reset_index(drop=True)
-
-# Save to CSV
-df.to_csv('fake_profiles.csv', index=False)
-
-print("✅ Dataset created successfully: fake_profiles.csv")
-print(df.head())
\ No newline at end of file
+    print(f"✅ Dataset created successfully: {args.rows} profiles in {len(paths)} file(s)")
+    for path in paths[:5]:
+        print(f"   {path}")
+    if args.format == 'csv':
+        print(pd.read_csv(paths[0], nrows=5))
@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Binary cache of the train/test splits written by preprocessing.py. Every
+# column is stored as its own raw binary file (integer counts as int32, strings
+# as fixed-width unicode) described by manifest.json, and memory-mapped on
+# load, so later runs skip CSV text parsing entirely. Raw files can also be
+# appended to in place, which the incremental mode of preprocessing.py uses.
+#
+# The manifest fingerprints the source file: its size and mtime, its SHA-256
+# (full builds only), how many bytes of it have been processed and a hash of
+# the last block before that point. The cache is only used while the source
+# content is unchanged.
+CACHE_DIR = 'split_cache'
+MANIFEST_FILE = 'manifest.json'
+CACHE_VERSION = 2
+SPLITS = ['X_train', 'X_test', 'y_train', 'y_test']
+TAIL_BLOCK = 1 << 16
+
+
+def file_sha256(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def tail_sha256(path, offset):
+    """Hash of the TAIL_BLOCK bytes before offset; detects a rewritten (not appended) source"""
+    with open(path, 'rb') as f:
+        f.seek(max(offset - TAIL_BLOCK, 0))
+        return hashlib.sha256(f.read(min(offset, TAIL_BLOCK))).hexdigest()
+
+
+def compact_column(values):
+    """int32 for integer columns that fit, fixed-width unicode for strings"""
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu':
+        info = np.iinfo(np.int32)
+        if len(values) == 0 or (values.min() >= info.min and values.max() <= info.max):
+            return values.astype(np.int32)
+    if values.dtype.kind not in 'biufU':
+        return values.astype(str)
+    return values
+
+
+def hash_split(usernames, test_fraction=0.2):
+    """True for rows that belong to the test split, decided by a stable FNV-1a hash
+    of the username, so a profile always lands in the same split on every run"""
+    names = np.asarray(usernames, dtype=str)
+    width = names.dtype.itemsize // 4
+    codes = np.ascontiguousarray(names).view(np.uint32).reshape(len(names), width)
+
+    hashes = np.full(len(names), 0xcbf29ce484222325, dtype=np.uint64)
+    for j in range(width):
+        # Padding code points are zero; leave the hash untouched past the end of the name
+        mixed = (hashes ^ codes[:, j].astype(np.uint64)) * np.uint64(0x100000001b3)
+        hashes = np.where(codes[:, j] != 0, mixed, hashes)
+    return hashes % np.uint64(10000) < np.uint64(int(test_fraction * 10000))
+
+
+def read_manifest(cache_dir=CACHE_DIR):
+    manifest_path = os.path.join(cache_dir, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    return manifest if manifest.get('version') == CACHE_VERSION else None
+
+
+def write_manifest(manifest, cache_dir=CACHE_DIR):
+    # Written last and atomically, so an interrupted update leaves the cache stale rather than torn
+    tmp_path = os.path.join(cache_dir, MANIFEST_FILE + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(cache_dir, MANIFEST_FILE))
+
+
+def column_path(cache_dir, split, column):
+    return os.path.join(cache_dir, f"{split}.{column}.bin")
+
+
+def fingerprint(manifest, source_path, offset, full_hash):
+    """Record which bytes of the source the cache now covers"""
+    stat = os.stat(source_path)
+    manifest.update({
+        'source': os.path.abspath(source_path),
+        'sha256': file_sha256(source_path) if full_hash else None,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'offset': offset,
+        'tail_sha256': tail_sha256(source_path, offset),
+    })
+    return manifest
+
+
+def new_manifest(split_method):
+    return {'version': CACHE_VERSION, 'split_method': split_method, 'splits': {}}
+
+
+def append_splits(manifest, parts, cache_dir=CACHE_DIR):
+    """Append rows to each split's column files, widening string columns if needed
+
+    parts maps split name -> DataFrame or Series. Cost is proportional to the
+    new rows, except when a longer string forces that column to be rewritten.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    for name, part in parts.items():
+        frame = part.to_frame() if isinstance(part, pd.Series) else part
+        spec = manifest['splits'].setdefault(
+            name, {'series': isinstance(part, pd.Series), 'rows': 0, 'columns': {}}
+        )
+
+        for column in frame.columns:
+            values = compact_column(frame[column].to_numpy())
+            path = column_path(cache_dir, name, column)
+            known = spec['columns'].get(column)
+
+            if known is not None and np.dtype(known) != values.dtype:
+                wider = np.promote_types(np.dtype(known), values.dtype)
+                if wider != np.dtype(known):
+                    # Rewrite the existing rows at the wider dtype, then append as usual
+                    existing = np.fromfile(path, dtype=np.dtype(known)).astype(wider)
+                    existing.tofile(path)
+                values = values.astype(wider)
+
+            with open(path, 'ab') as f:
+                values.tofile(f)
+            spec['columns'][column] = values.dtype.str
+        spec['rows'] += len(frame)
+
+
+def reset_cache(split_method, cache_dir=CACHE_DIR):
+    """Remove any cached columns and start a new, empty manifest"""
+    if os.path.isdir(cache_dir):
+        for filename in os.listdir(cache_dir):
+            if filename.endswith('.bin') or filename == MANIFEST_FILE:
+                os.remove(os.path.join(cache_dir, filename))
+    return new_manifest(split_method)
+
+
+def save_splits(source_path, X_train, X_test, y_train, y_test, cache_dir=CACHE_DIR):
+    """Replace the cache with the four splits of a full build"""
+    manifest = reset_cache('random', cache_dir)
+    append_splits(manifest, dict(zip(SPLITS, [X_train, X_test, y_train, y_test])), cache_dir)
+    write_manifest(fingerprint(manifest, source_path, os.path.getsize(source_path), full_hash=True), cache_dir)
+
+
+def is_fresh(source_path, manifest):
+    """True when the source file still has the content the cache was built from"""
+    if not os.path.exists(source_path):
+        return False
+    stat = os.stat(source_path)
+    if stat.st_size != manifest['size']:
+        return False
+    # Unchanged size and mtime: trust the cache without rehashing the whole file
+    if stat.st_mtime_ns == manifest['mtime_ns']:
+        return True
+    return manifest['sha256'] is not None and file_sha256(source_path) == manifest['sha256']
+
+
+def appended_since(source_path, manifest):
+    """True when the source only grew past the processed offset since the cache was written"""
+    if manifest is None or manifest['source'] != os.path.abspath(source_path):
+        return False
+    if not os.path.exists(source_path) or os.path.getsize(source_path) < manifest['offset']:
+        return False
+    return tail_sha256(source_path, manifest['offset']) == manifest['tail_sha256']
+
+
+def load_splits(source_path, cache_dir=CACHE_DIR):
+    """Return (X_train, X_test, y_train, y_test) from the cache, or None if missing or stale"""
+    manifest = read_manifest(cache_dir)
+    if manifest is None:
+        return None
+    if manifest['source'] != os.path.abspath(source_path) or not is_fresh(source_path, manifest):
+        return None
+
+    splits = []
+    for name in SPLITS:
+        spec = manifest['splits'][name]
+        columns = {}
+        for column, dtype in spec['columns'].items():
+            if spec['rows'] == 0:
+                columns[column] = np.empty(0, dtype=np.dtype(dtype))
+            else:
+                # Memory-mapped column arrays; pandas wraps them without copying
+                columns[column] = np.memmap(column_path(cache_dir, name, column), dtype=np.dtype(dtype),
+                                            mode='r', shape=(spec['rows'],))
+        frame = pd.DataFrame(columns, copy=False)
+        splits.append(frame[next(iter(spec['columns']))] if spec['series'] else frame)
+    return tuple(splits)
@@ -0,0 +1,13 @@
+import sys
+
+import joblib
+
+from scorer import export_scorer
+
+# Usage: python export_scorer.py [best_model.pkl] [best_model_scorer.pkl]
+source = sys.argv[1] if len(sys.argv) > 1 else 'best_model.pkl'
+target = sys.argv[2] if len(sys.argv) > 2 else 'best_model_scorer.pkl'
+
+scorer = export_scorer(joblib.load(source))
+joblib.dump(scorer, target)
+print(f"✅ Scorer exported: {type(scorer).__name__} ({target})")
@@ -0,0 +1,184 @@
+import numpy as np
+
+# Order of the columns the served model was trained on (see app.predict)
+FEATURE_FIELDS = ['username', 'num_followers', 'num_following', 'account_age_days', 'posts_count']
+
+# Dataset-style column names accepted in place of the form field names
+FIELD_ALIASES = {
+    'followers': 'num_followers',
+    'following': 'num_following',
+    'posts': 'posts_count',
+}
+
+
+def normalize_columns(frame):
+    """Rename dataset-style columns to the form field names used by app.py"""
+    renames = {
+        alias: field for alias, field in FIELD_ALIASES.items()
+        if alias in frame.columns and field not in frame.columns
+    }
+    if renames:
+        frame = frame.rename(columns=renames)
+
+    missing = [field for field in FEATURE_FIELDS if field not in frame.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    return frame
+
+
+def numeric_values(frame, columns, out):
+    """Fill out with frame[columns] as numbers; a missing, null or non-numeric value
+    raises ValueError naming its columns"""
+    import pandas as pd
+
+    invalid = []
+    for i, column in enumerate(columns):
+        values = frame[column]
+        if not pd.api.types.is_numeric_dtype(values):
+            values = pd.to_numeric(values, errors='coerce')
+        values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        if np.isnan(values).any():
+            invalid.append(column)
+        out[:, i] = values
+    if invalid:
+        raise ValueError(f"Missing or non-numeric values in: {', '.join(invalid)}")
+
+
+def build_feature_matrix(frame, dtype=np.float64):
+    """Build the model input for a whole frame of profiles in one pass"""
+    frame = normalize_columns(frame)
+
+    features = np.empty((len(frame), len(FEATURE_FIELDS)), dtype=dtype)
+    features[:, 0] = frame['username'].fillna('').astype(str).str.len().to_numpy()
+    numeric_values(frame, FEATURE_FIELDS[1:], features[:, 1:])
+    return features
+
+
+def model_features(model, frame, dtype=np.float64):
+    """Model input for a frame of profiles; a fused pipeline encodes and orders columns itself"""
+    if hasattr(model, 'transform'):
+        return model.transform(frame, dtype=dtype)
+
+    # A bare estimator only fits if it was trained on build_feature_matrix's columns,
+    # not e.g. the scaled username-feature models model.py now saves as best_model.pkl
+    n_features = getattr(model, 'n_features_in_', len(FEATURE_FIELDS))
+    if n_features != len(FEATURE_FIELDS):
+        raise ValueError(
+            f"{type(model).__name__} expects {n_features} features, not the {len(FEATURE_FIELDS)} "
+            f"form fields; serve the inference pipeline (pipeline.pkl or pipeline.artifact) instead"
+        )
+    return build_feature_matrix(frame, dtype=dtype)
+
+
+def predict_scores(model, features):
+    """(predicted labels, fake probabilities) for a feature matrix; the
+    probabilities are None for models without predict_proba, such as SVC"""
+    if hasattr(model, 'predict_proba'):
+        proba = model.predict_proba(features)
+        return model.classes_.take(proba.argmax(axis=1)), proba[:, 1]
+    return model.predict(features), None
+
+
+# Username features: computed from the characters alone, so there is no fitted
+# vocabulary, memory does not grow with the number of usernames seen, and
+# unseen usernames at inference are handled exactly like training ones.
+USERNAME_BUCKETS = 16
+USERNAME_NGRAM = 3
+# Characters looked at per username: the code-point matrix is rows x width, so
+# one pathological name must not set the width for the whole batch
+USERNAME_MAX_LENGTH = 64
+VOWELS = np.array([ord(c) for c in 'aeiou'], dtype=np.uint32)
+
+
+def username_feature_names(n_buckets=USERNAME_BUCKETS):
+    return [
+        'username_length', 'username_digit_ratio',
+        'username_trailing_digits', 'username_max_vowel_run',
+    ] + [f'username_ngram_{i}' for i in range(n_buckets)]
+
+
+def run_lengths(mask):
+    """Length of the run of True values ending at each position of every row"""
+    runs = np.zeros(mask.shape, dtype=np.int32)
+    current = np.zeros(mask.shape[0], dtype=np.int32)
+    for j in range(mask.shape[1]):
+        current = np.where(mask[:, j], current + 1, 0)
+        runs[:, j] = current
+    return runs
+
+
+def username_features(usernames, n_buckets=USERNAME_BUCKETS):
+    """Length, digit ratio, trailing-digit run, longest vowel run and hashed
+    character n-gram counts for a whole column of usernames at once
+
+    Only the first USERNAME_MAX_LENGTH characters of each name are used.
+    """
+    names = np.asarray(usernames, dtype=f'U{USERNAME_MAX_LENGTH}')
+    n = len(names)
+    # Narrow to the longest name in the batch, as short names are the norm
+    names = np.char.lower(names.astype(f'U{max(np.char.str_len(names).max(initial=0), 1)}'))
+    width = names.dtype.itemsize // 4
+
+    # One row of Unicode code points per username, zero-padded on the right
+    codes = np.ascontiguousarray(names).view(np.uint32).reshape(n, width)
+    length = (codes != 0).sum(axis=1)
+
+    is_digit = (codes >= ord('0')) & (codes <= ord('9'))
+    digit_runs = run_lengths(is_digit)
+    last = np.maximum(length - 1, 0)
+    trailing_digits = np.where(length > 0, digit_runs[np.arange(n), last], 0)
+
+    vowel_runs = run_lengths(np.isin(codes, VOWELS))
+    max_vowel_run = vowel_runs.max(axis=1) if width else np.zeros(n, dtype=np.int32)
+
+    # Hashed n-gram counts; the hash only depends on the code points, so it is
+    # stable across processes (unlike Python's salted hash())
+    ngram_counts = np.zeros((n, n_buckets))
+    positions = width - USERNAME_NGRAM + 1
+    if positions > 0:
+        hashes = np.zeros((n, positions), dtype=np.uint64)
+        for k in range(USERNAME_NGRAM):
+            hashes = hashes * np.uint64(31) + codes[:, k:k + positions]
+        buckets = ((hashes * np.uint64(2654435761)) >> np.uint64(16)) % np.uint64(n_buckets)
+
+        valid = np.arange(positions)[None, :] + USERNAME_NGRAM <= length[:, None]
+        rows = np.broadcast_to(np.arange(n)[:, None], valid.shape)
+        flat = rows[valid] * n_buckets + buckets[valid].astype(np.intp)
+        ngram_counts = np.bincount(flat, minlength=n * n_buckets).reshape(n, n_buckets)
+
+    features = np.empty((n, 4 + n_buckets))
+    features[:, 0] = length
+    features[:, 1] = is_digit.sum(axis=1) / np.maximum(length, 1)
+    features[:, 2] = trailing_digits
+    features[:, 3] = max_vowel_run
+    features[:, 4:] = ngram_counts
+    return features
+
+
+def model_matrix(frame, numeric_columns, n_buckets=USERNAME_BUCKETS, dtype=np.float64):
+    """Username features followed by numeric_columns: the column layout every model
+    in model.py, train_streaming.py and update_model.py is trained and served on
+
+    Filled straight into one matrix, as this runs on every served request.
+    With n_buckets=0 the username features are left out.
+    """
+    required = (['username'] if n_buckets else []) + list(numeric_columns)
+    missing = [column for column in required if column not in frame.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    offset = 4 + n_buckets if n_buckets else 0
+    features = np.empty((len(frame), offset + len(numeric_columns)), dtype=dtype)
+    if n_buckets:
+        usernames = frame['username'].fillna('').astype(str).to_numpy()
+        features[:, :offset] = username_features(usernames, n_buckets)
+    numeric_values(frame, numeric_columns, features[:, offset:])
+    return features
+
+
+def model_frame(frame, numeric_columns, n_buckets=USERNAME_BUCKETS):
+    """model_matrix as a DataFrame with named columns, as the scalers are fitted on"""
+    import pandas as pd
+
+    names = (username_feature_names(n_buckets) if n_buckets else []) + list(numeric_columns)
+    return pd.DataFrame(model_matrix(frame, numeric_columns, n_buckets), columns=names, index=frame.index)
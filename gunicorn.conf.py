@@ -0,0 +1,29 @@
+import gc
+import os
+
+# gunicorn settings for wsgi.py; every value can be overridden through the
+# environment, e.g. WEB_CONCURRENCY=8 WEB_THREADS=2 gunicorn -c gunicorn.conf.py wsgi:application
+
+bind = os.environ.get('BIND', '0.0.0.0:8000')
+
+# Worker processes (one per core by default) with a thread pool each, so a
+# worker keeps serving while some of its requests wait on the network
+workers = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1))
+threads = int(os.environ.get('WEB_THREADS', 4))
+worker_class = 'gthread'
+
+# Import wsgi.py (and load the model) in the master, before the workers fork
+preload_app = True
+
+timeout = int(os.environ.get('WEB_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('WEB_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('WEB_KEEPALIVE', 5))
+max_requests = int(os.environ.get('WEB_MAX_REQUESTS', 0))
+max_requests_jitter = max_requests // 10
+
+
+def when_ready(server):
+    # Move everything loaded so far (the model included) out of the garbage
+    # collector's reach; otherwise its first collection in each worker writes
+    # to those objects and un-shares their copy-on-write pages
+    gc.freeze()
@@ -0,0 +1,189 @@
+from collections import defaultdict, deque
+from threading import Lock
+from urllib.parse import urlsplit
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Pooled keep-alive HTTP layer for the profile scrapers in tests.py. One
+# requests.Session keeps connections to each host open between fetches
+# (skipping DNS, TCP and TLS setup on every call), caps the connections per
+# host, asks for compressed responses and retries transient failures with
+# exponential backoff. Per-host counters show how often connections were
+# reused and how long the first response byte took.
+
+# Statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Transient server errors only, for callers that handle 429 themselves
+SERVER_ERROR_STATUSES = (500, 502, 503, 504)
+
+
+class CappedRetry(Retry):
+    """Retry that only retries status_forcelist and sleeps at most max_retry_after seconds
+
+    Plain Retry also retries 413, 429 and 503 whenever they carry a
+    Retry-After header, whether or not they are in status_forcelist.
+    """
+
+    def __init__(self, *args, max_retry_after=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_retry_after = max_retry_after
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.max_retry_after = self.max_retry_after
+        return retry
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if self.status_forcelist is not None and status_code not in self.status_forcelist:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_retry_after(self, response):
+        seconds = super().get_retry_after(response)
+        if seconds is not None and self.max_retry_after is not None:
+            seconds = min(seconds, self.max_retry_after)
+        return seconds
+
+
+class HostStats:
+    """Thread-safe per-host request, connection and time-to-first-byte counters"""
+
+    def __init__(self, window=1000):
+        self.lock = Lock()
+        self.requests = defaultdict(int)
+        self.connections = defaultdict(int)
+        self.retries = defaultdict(int)
+        self.compressed = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.ttfb = defaultdict(lambda: deque(maxlen=window))
+
+    def record_connection(self, host):
+        with self.lock:
+            self.connections[host] += 1
+
+    def record_error(self, host):
+        with self.lock:
+            self.errors[host] += 1
+
+    def record_response(self, host, ttfb, retries, compressed):
+        with self.lock:
+            self.requests[host] += 1
+            self.retries[host] += retries
+            self.compressed[host] += compressed
+            self.ttfb[host].append(ttfb)
+
+    def report(self):
+        """{host: counters}; reuse_rate is the share of requests that did not open a connection"""
+        with self.lock:
+            report = {}
+            for host in sorted(set(self.requests) | set(self.connections) | set(self.errors)):
+                requests_sent = self.requests[host] + self.retries[host] + self.errors[host]
+                ttfb_ms = np.array(self.ttfb[host]) * 1000
+                report[host] = {
+                    'requests': self.requests[host],
+                    'connections': self.connections[host],
+                    'reuse_rate': 1 - self.connections[host] / requests_sent if requests_sent else 0.0,
+                    'retries': self.retries[host],
+                    'errors': self.errors[host],
+                    'compressed': self.compressed[host],
+                    'ttfb_ms_p50': float(np.percentile(ttfb_ms, 50)) if len(ttfb_ms) else None,
+                    'ttfb_ms_p95': float(np.percentile(ttfb_ms, 95)) if len(ttfb_ms) else None,
+                }
+            return report
+
+
+class CountingPoolManager(PoolManager):
+    """PoolManager whose per-host pools report every new connection they open"""
+
+    def __init__(self, stats, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = stats
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        new_conn = pool._new_conn
+        stats = self.stats
+
+        def counted_new_conn():
+            stats.record_connection(host)
+            return new_conn()
+
+        pool._new_conn = counted_new_conn
+        return pool
+
+
+class CountingAdapter(HTTPAdapter):
+    def __init__(self, stats, **kwargs):
+        self.stats = stats  # needed by init_poolmanager, which HTTPAdapter.__init__ calls
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = CountingPoolManager(self.stats, num_pools=connections, maxsize=maxsize,
+                                               block=block, **pool_kwargs)
+
+
+class PooledSession:
+    """requests.Session with per-host connection limits, compression, retries and statistics
+
+    per_host_connections is a hard cap: with more concurrent fetches to one
+    host than that, the extra threads wait for a free connection instead of
+    opening another one. A retry waits for the server's Retry-After, but
+    never longer than max_retry_after seconds.
+    """
+
+    def __init__(self, headers=None, per_host_connections=8, max_hosts=32,
+                 retries=3, backoff_factor=0.5, retry_statuses=RETRY_STATUSES,
+                 max_retry_after=30.0):
+        self.stats = HostStats()
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+
+        retry = CappedRetry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=retry_statuses,
+            allowed_methods=['GET', 'HEAD'],
+            respect_retry_after_header=True,
+            raise_on_status=False,  # the last response is returned; callers check the status
+            max_retry_after=max_retry_after,
+        )
+        adapter = CountingAdapter(self.stats, pool_connections=max_hosts,
+                                  pool_maxsize=per_host_connections, pool_block=True,
+                                  max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, url, **kwargs):
+        try:
+            response = self.session.get(url, **kwargs)
+        except requests.RequestException:
+            self.stats.record_error(urlsplit(url).hostname)
+            raise
+
+        # One entry per redirect hop. elapsed stops when the headers are parsed:
+        # time to first byte, including connection setup and any retries
+        for hop in [*response.history, response]:
+            retries = hop.raw.retries
+            self.stats.record_response(
+                urlsplit(hop.url).hostname,
+                hop.elapsed.total_seconds(),
+                len(retries.history) if retries else 0,
+                'Content-Encoding' in hop.headers,
+            )
+        return response
+
+    def report(self):
+        return self.stats.report()
+
+    def close(self):
+        self.session.close()
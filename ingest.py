@@ -0,0 +1,174 @@
+import io
+import json
+
+import numpy as np
+import pandas as pd
+
+# Column types for every profile column the repo's datasets use. Counts fit
+# comfortably in int32 and flags in uint8, which is about 4x smaller than the
+# int64/object columns a default read_csv produces.
+PROFILE_SCHEMA = {
+    'username': 'str',
+    'followers': 'int32',
+    'following': 'int32',
+    'posts': 'int32',
+    'bio_length': 'int32',
+    'account_age': 'int32',
+    'account_age_days': 'int32',
+    'has_bio': 'uint8',
+    'has_profile_picture': 'uint8',
+    # Form field names used by app.py uploads
+    'num_followers': 'int32',
+    'num_following': 'int32',
+    'posts_count': 'int32',
+}
+
+# Label spellings found in the datasets, mapped to the model's 1 = fake convention
+LABELS = {'fake': 1, 'real': 0, 'genuine': 0, '1': 1, '0': 0}
+
+# Nullable twins of the compact dtypes, so bad cells parse as <NA> instead of failing
+NULLABLE = {'int32': 'Int32', 'uint8': 'UInt8'}
+
+
+def sniff_delimiter(first_line):
+    """The datasets are either tab- or comma-separated; decide from the header line"""
+    return '\t' if first_line.count('\t') > first_line.count(',') else ','
+
+
+def read_header(source):
+    """Return (delimiter, column names) from the first line of a path or binary/text stream"""
+    if hasattr(source, 'read'):
+        first_line = source.readline()
+        source.seek(0)
+    else:
+        with open(source, 'rb') as f:
+            first_line = f.readline()
+    if isinstance(first_line, bytes):
+        first_line = first_line.decode('utf-8', errors='replace')
+    first_line = first_line.rstrip('\r\n')
+    sep = sniff_delimiter(first_line)
+    return sep, first_line.split(sep)
+
+
+def numeric_columns(frame):
+    return [column for column in frame.columns if PROFILE_SCHEMA.get(column) in NULLABLE]
+
+
+def invalid_rows(frame):
+    """Rows with a blank or unparseable number, as kept by read_profiles(keep_invalid=True)"""
+    return frame[numeric_columns(frame)].isna().any(axis=1)
+
+
+def coerce_profiles(frame, keep_invalid=False):
+    """Drop repeated header lines, cast to the compact schema dtypes and map labels to 0/1
+
+    Any other blank or unparseable number raises ValueError, unless
+    keep_invalid, which leaves it as <NA> (see invalid_rows) so that every
+    input row can still be reported on.
+    """
+    # Concatenated exports repeat the header line
+    repeated_header = pd.Series(False, index=frame.index)
+    for column in ['username', 'label']:
+        if column in frame.columns:
+            repeated_header |= frame[column] == column
+    frame = frame[~repeated_header]
+
+    numeric = numeric_columns(frame)
+    if keep_invalid:
+        # Read as text (see read_profiles): anything that is not a number becomes <NA>
+        frame = frame.assign(**{
+            column: pd.to_numeric(frame[column], errors='coerce').astype(NULLABLE[PROFILE_SCHEMA[column]])
+            for column in numeric if not pd.api.types.is_numeric_dtype(frame[column])
+        })
+    incomplete = [column for column in numeric if frame[column].isna().any()]
+    if incomplete and not keep_invalid:
+        raise ValueError(f"{int(invalid_rows(frame).sum())} rows have blank or unparseable values "
+                         f"in {', '.join(incomplete)}")
+
+    frame = frame.astype({column: PROFILE_SCHEMA[column] for column in numeric if column not in incomplete})
+
+    if 'label' in frame.columns:
+        labels = frame['label'].astype(str).str.strip().str.lower()
+        unknown = set(labels.unique()) - set(LABELS)
+        if unknown:
+            raise ValueError(f"Unknown labels: {', '.join(sorted(unknown))}")
+        frame = frame.assign(label=labels.map(LABELS).astype(np.uint8))
+    return frame
+
+
+class ByteRange(io.RawIOBase):
+    """Read-only stream over bytes [start, end) of a file"""
+
+    def __init__(self, path, start, end):
+        self.file = open(path, 'rb')
+        self.file.seek(start)
+        self.remaining = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = self.file.readinto(memoryview(buffer)[:min(len(buffer), self.remaining)])
+        self.remaining -= n
+        return n
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+def data_range(path):
+    """(start, end) byte offsets of the complete data lines: after the header, up to the last newline"""
+    with open(path, 'rb') as f:
+        start = len(f.readline())
+        end = f.seek(0, io.SEEK_END)
+        # A trailing partial line (an export still being written) is left for the next run
+        while end > start:
+            f.seek(max(end - 4096, start))
+            block = f.read(end - max(end - 4096, start))
+            newline = block.rfind(b'\n')
+            if newline != -1:
+                return start, end - len(block) + newline + 1
+            end -= len(block)
+    return start, start
+
+
+def read_profiles(source, chunksize=None, schema_only=True, byte_range=None, keep_invalid=False):
+    """Read a profile CSV (path or stream) with the delimiter sniffed once and
+    explicit dtypes, returning a DataFrame or, with chunksize, an iterator of them
+
+    With schema_only, columns outside PROFILE_SCHEMA (and 'label') are not parsed
+    at all; otherwise they are kept as strings. byte_range=(start, end) parses
+    only those bytes of a file path, using the header from its first line.
+    keep_invalid is passed on to coerce_profiles.
+    """
+    sep, header = read_header(source)
+    known = [column for column in header if column in PROFILE_SCHEMA or column == 'label']
+
+    dtype = {
+        column: 'str' if keep_invalid else NULLABLE.get(PROFILE_SCHEMA[column], PROFILE_SCHEMA[column])
+        for column in known if column != 'label'
+    }
+    dtype['label'] = 'str'
+    na_values = {column: [column] for column in known if PROFILE_SCHEMA.get(column) in NULLABLE}
+
+    options = {}
+    if byte_range is not None:
+        source = io.BufferedReader(ByteRange(source, *byte_range))
+        options = {'header': None, 'names': header}
+
+    reader = pd.read_csv(
+        source, sep=sep, dtype=dtype, na_values=na_values, keep_default_na=False,
+        usecols=known if schema_only else None, chunksize=chunksize, engine='c', **options,
+    )
+    if chunksize is None:
+        return coerce_profiles(reader, keep_invalid)
+    return (coerce_profiles(chunk, keep_invalid) for chunk in reader)
+
+
+def parse_profiles(body, content_type):
+    """Parse a JSON array of profiles or newline-delimited JSON (one profile per line)"""
+    text = body.decode('utf-8')
+    if 'ndjson' in content_type or not text.lstrip().startswith('['):
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    return json.loads(text)
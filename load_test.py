@@ -0,0 +1,198 @@
+import argparse
+import http.client
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import numpy as np
+
+# Closed-loop load test of the prediction service: --concurrency clients each
+# send their next request as soon as the previous one is answered. Targets are
+# started here ('dev' = app.py's development server, 'wsgi' = gunicorn with
+# gunicorn.conf.py, 'asgi' = uvicorn serving asgi.py) or given as the base URL
+# of an already running server.
+#
+#     python load_test.py dev wsgi --concurrency 32 --duration 15
+
+parser = argparse.ArgumentParser(description="Measure requests/sec and tail latency of the prediction service")
+parser.add_argument('targets', nargs='*', default=['dev', 'wsgi'],
+                    help="'dev', 'wsgi', 'asgi' or a base URL such as http://127.0.0.1:8000 (first one is the baseline)")
+parser.add_argument('--concurrency', type=int, default=16, help="concurrent client connections")
+parser.add_argument('--duration', type=float, default=10.0, help="seconds of load per target")
+parser.add_argument('--warmup', type=float, default=1.0, help="seconds of load before measuring")
+parser.add_argument('--rows', type=int, default=1, help="profiles per /api/predict request")
+parser.add_argument('--client-procs', type=int, default=min(4, os.cpu_count() or 1),
+                    help="client processes, so the load generator itself is not GIL-bound")
+parser.add_argument('--workers', type=int, default=None, help="worker processes for the 'wsgi' and 'asgi' targets")
+parser.add_argument('--threads', type=int, default=None, help="WEB_THREADS for the 'wsgi' target")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(kind, args):
+    """Start a server for 'dev', 'wsgi' or 'asgi' on a free port; returns (process, base_url)"""
+    port = free_port()
+    env = dict(os.environ)
+    if kind == 'dev':
+        # Exactly what `python app.py` runs, on another port
+        command = [sys.executable, '-c', f"import app; app.app.run(port={port}, debug=True)"]
+    elif kind == 'asgi':
+        command = [sys.executable, '-m', 'uvicorn', 'asgi:app', '--port', str(port), '--no-access-log',
+                   '--workers', str(args.workers or 1)]
+    else:
+        if args.workers is not None:
+            env['WEB_CONCURRENCY'] = str(args.workers)
+        if args.threads is not None:
+            env['WEB_THREADS'] = str(args.threads)
+        env['BIND'] = f"127.0.0.1:{port}"
+        command = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:application']
+
+    # Own process group, so the dev server's reloader child is stopped with it
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                               start_new_session=True)
+    return process, f"http://127.0.0.1:{port}"
+
+
+def stop_server(process):
+    if hasattr(os, 'killpg'):
+        os.killpg(process.pid, signal.SIGTERM)
+    else:
+        process.terminate()
+    process.wait(timeout=30)
+
+
+def wait_ready(base_url, timeout=60.0):
+    parts = urlsplit(base_url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=2)
+            conn.request('GET', '/metrics/model')
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{base_url} did not become ready within {timeout:.0f}s")
+
+
+def request_body(rows):
+    # The fields /api/predict documents; the fused pipeline maps them to its training columns
+    profile = {'username': 'user_48213', 'num_followers': 120, 'num_following': 310,
+               'posts_count': 42, 'account_age_days': 640}
+    return json.dumps([profile] * rows).encode()
+
+
+def check_predict(base_url, body):
+    """Send one request up front, so a service that rejects it fails with its own error message"""
+    parts = urlsplit(base_url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+    try:
+        conn.request('POST', '/api/predict', body=body, headers={'Content-Type': 'application/json'})
+        response = conn.getresponse()
+        if response.status != 200:
+            raise RuntimeError(f"{base_url}/api/predict answered {response.status}: "
+                               f"{response.read().decode(errors='replace')[:500]}")
+    finally:
+        conn.close()
+
+
+def client(base_url, body, start_at, measure_from, stop_at):
+    """One keep-alive connection in a closed loop; returns (latencies, errors) after measure_from"""
+    parts = urlsplit(base_url)
+    headers = {'Content-Type': 'application/json'}
+    conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+    latencies = []
+    errors = 0
+
+    time.sleep(max(start_at - time.time(), 0))
+    while True:
+        start = time.time()
+        if start >= stop_at:
+            break
+        try:
+            conn.request('POST', '/api/predict', body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            ok = response.status == 200
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            ok = False
+        if start >= measure_from:
+            if ok:
+                latencies.append(time.time() - start)
+            else:
+                errors += 1
+    conn.close()
+    return latencies, errors
+
+
+def client_process(base_url, body, clients, start_at, measure_from, stop_at):
+    with ThreadPoolExecutor(clients) as pool:
+        results = list(pool.map(lambda _: client(base_url, body, start_at, measure_from, stop_at),
+                                range(clients)))
+    return [x for latencies, _ in results for x in latencies], sum(errors for _, errors in results)
+
+
+def run_load(base_url, args):
+    body = request_body(args.rows)
+    procs = max(1, min(args.client_procs, args.concurrency))
+    shares = [args.concurrency // procs + (i < args.concurrency % procs) for i in range(procs)]
+
+    # Wall-clock schedule shared by every client process
+    start_at = time.time() + 1.0
+    measure_from = start_at + args.warmup
+    stop_at = measure_from + args.duration
+    with ProcessPoolExecutor(procs) as pool:
+        results = list(pool.map(client_process, [base_url] * procs, [body] * procs, shares,
+                                [start_at] * procs, [measure_from] * procs, [stop_at] * procs))
+
+    latencies = np.array([x for part, _ in results for x in part]) * 1000
+    errors = sum(errors for _, errors in results)
+    report = {'requests': len(latencies), 'errors': errors, 'rps': len(latencies) / args.duration}
+    for name, q in [('p50', 50), ('p90', 90), ('p99', 99), ('p99.9', 99.9)]:
+        report[name] = float(np.percentile(latencies, q)) if len(latencies) else float('nan')
+    report['max'] = float(latencies.max()) if len(latencies) else float('nan')
+    return report
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    reports = {}
+    for target in args.targets:
+        process = None
+        if target in ('dev', 'wsgi', 'asgi'):
+            process, base_url = start_server(target, args)
+        else:
+            base_url = target.rstrip('/')
+        try:
+            wait_ready(base_url)
+            check_predict(base_url, request_body(args.rows))
+            print(f"Loading {target} ({base_url}): {args.concurrency} clients, {args.duration:.0f}s ...")
+            reports[target] = run_load(base_url, args)
+        finally:
+            if process is not None:
+                stop_server(process)
+
+    print(f"\n{'target':<28}{'req/s':>10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}"
+          f"{'p99.9 ms':>10}{'max ms':>10}{'errors':>8}")
+    baseline = reports[args.targets[0]]['rps']
+    for target, r in reports.items():
+        speedup = f"  {r['rps'] / baseline:.1f}x" if baseline and target != args.targets[0] else ''
+        print(f"{target:<28}{r['rps']:>10.0f}{r['p50']:>10.2f}{r['p90']:>10.2f}{r['p99']:>10.2f}"
+              f"{r['p99.9']:>10.2f}{r['max']:>10.2f}{r['errors']:>8}{speedup}")
+
+    # Failed requests make the comparison meaningless, so they fail the run
+    failed = [target for target, r in reports.items() if r['errors'] or not r['requests']]
+    if failed:
+        sys.exit(f"\nFailed requests or no successful ones for: {', '.join(failed)}")
@@ -1,59 +1,114 @@
-import pandas as pd
+import argparse
+import json
+import time
+
 import matplotlib.pyplot as plt
 import joblib
 
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sklearn.preprocessing import StandardScaler
 from sklearn.linear_model import LogisticRegression
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.svm import SVC
 from sklearn.metrics import accuracy_score, confusion_matrix, classification_report
 
-# Step 1: Load the dataset
-df = pd.read_csv('fake_profiles.csv')
+from features import model_frame, USERNAME_BUCKETS
+from pipeline import build_pipeline
+from artifact import save_artifact
+from dataset_cache import load_splits, CACHE_DIR
+from ingest import read_profiles
+from training import train_models, measure_latency, select_model
+
+parser = argparse.ArgumentParser(description="Train and select the fake profile model")
+parser.add_argument('--parallel', action='store_true',
+                    help="fit the candidate models across a process pool")
+parser.add_argument('--jobs', type=int, default=-1,
+                    help="worker processes for --parallel and RandomForest (-1 = all cores)")
+parser.add_argument('--search', action='store_true',
+                    help="tune each family with cross-validated successive halving before training")
+parser.add_argument('--cv', type=int, default=5, help="folds for --search")
+parser.add_argument('--objective', choices=['accuracy', 'accuracy_per_us'], default=None,
+                    help="latency-aware selection of the best model (default: accuracy only)")
+parser.add_argument('--latency-budget-us', type=float, default=None,
+                    help="only select models whose single-row predict latency fits this budget")
+args = parser.parse_args()
+
+# Step 1: Load the dataset, already split, from preprocessing.py's binary cache when it
+# matches the current CSV; otherwise parse the CSV and split it the same way
+cached_splits = load_splits('fake_profiles.csv')
+if cached_splits is not None:
+    X_train_raw, X_test_raw, y_train, y_test = cached_splits
+    print(f"✅ Loaded train/test splits from {CACHE_DIR}/")
+else:
+    df = read_profiles('fake_profiles.csv')
+    X_train_raw, X_test_raw, y_train, y_test = train_test_split(
+        df.drop('label', axis=1), df['label'], test_size=0.2, random_state=42
+    )
 
-# Step 2: Encode categorical features
-label_encoder = LabelEncoder()
-df['username'] = label_encoder.fit_transform(df['username'])
+# Step 2: Extract username features (no fitted vocabulary, so unseen usernames work at inference)
+numeric_columns = [column for column in X_train_raw.columns if column != 'username']
 
 # Step 3: Define features and target
-X = df.drop('label', axis=1)
-y = df['label']
+X_train_features = model_frame(X_train_raw, numeric_columns)
+X_test_features = model_frame(X_test_raw, numeric_columns)
 
-# Step 4: Feature Scaling
+# Step 4: Feature Scaling (fitted on the training split only)
 scaler = StandardScaler()
-X_scaled = scaler.fit_transform(X)
+X_train = scaler.fit_transform(X_train_features)
+X_test = scaler.transform(X_test_features)
 
 # ✅ Save the scaler
 joblib.dump(scaler, 'scaler.pkl')
 print("✅ Scaler saved as scaler.pkl")
 
-# Step 5: Split the data
-X_train, X_test, y_train, y_test = train_test_split(
-    X_scaled, y, test_size=0.2, random_state=42
-)
-
 # Step 6: Initialize models with tuned hyperparameters
 models = {
     "Logistic Regression": LogisticRegression(max_iter=1000),
     "Decision Tree": DecisionTreeClassifier(max_depth=5),
-    "Random Forest": RandomForestClassifier(n_estimators=100, max_depth=5),
+    "Random Forest": RandomForestClassifier(n_estimators=100, max_depth=5, n_jobs=args.jobs),
     "SVM": SVC(kernel='rbf', C=1.0, gamma='scale')
 }
 
+# Step 6b (optional): Replace the hardcoded hyperparameters with the best searched config per family
+if args.search:
+    from search import run_search
+
+    ranking = run_search(X_train, y_train, X_test, cv=args.cv, n_jobs=args.jobs)
+    print("\n----- Hyperparameter search (ranked by CV accuracy, then latency) -----")
+    print(ranking[['family', 'params', 'cv_accuracy', 'single_row_us', 'batch_row_us', 'pareto']]
+          .to_string(index=False))
+
+    for family, group in ranking.groupby('family', sort=False):
+        models[family] = group.iloc[0]['model']
+
 accuracies = {}
+latencies = {}
+pipelines = {}
 
 # Step 7: Train, Predict, and Evaluate each model
-for name, model in models.items():
+start = time.perf_counter()
+fitted = train_models(models, X_train, y_train, n_jobs=args.jobs if args.parallel else 1)
+print(f"\nTrained {len(fitted)} models in {time.perf_counter() - start:.2f}s")
+
+for name, (model, fit_seconds) in fitted.items():
+    models[name] = model  # fitted copies come back from the worker processes
+    if 'n_jobs' in model.get_params():
+        # --jobs is for fitting; served predict calls are small and must not fan out to joblib workers
+        model.set_params(n_jobs=None)
     print(f"\n----- {name} -----")
-    model.fit(X_train, y_train)
+    print(f"Training time: {fit_seconds:.2f}s")
     y_pred = model.predict(X_test)
     
     accuracy = accuracy_score(y_test, y_pred)
     accuracies[name] = accuracy  # Save accuracy
+    # Time what would be served: the fused pipeline, scoring raw profile columns
+    pipelines[name] = build_pipeline(numeric_columns, scaler, model, username_buckets=USERNAME_BUCKETS)
+    latencies[name] = measure_latency(pipelines[name], X_test_raw)
     
     print(f"Accuracy: {accuracy:.2f}")
+    print(f"Served pipeline latency: {latencies[name]['single_row_us']:.1f} µs single row, "
+          f"{latencies[name]['batch_row_us']:.2f} µs/row batched")
     print("Confusion Matrix:\n", confusion_matrix(y_test, y_pred))
     print("Classification Report:\n", classification_report(y_test, y_pred))
 
@@ -69,8 +124,30 @@ plt.tight_layout()
 plt.show()
 
 # Step 9: Save the Best Model
-best_model_name = max(accuracies, key=accuracies.get)
+if args.objective is None and args.latency_budget_us is None:
+    best_model_name = max(accuracies, key=accuracies.get)
+else:
+    best_model_name = select_model(accuracies, latencies, objective=args.objective or 'accuracy',
+                                   latency_budget_us=args.latency_budget_us)
 best_model = models[best_model_name]
 
 joblib.dump(best_model, 'best_model.pkl')
-print(f"\n✅ Best model saved: {best_model_name} (best_model.pkl)")
\ No newline at end of file
+print(f"\n✅ Best model saved: {best_model_name} (best_model.pkl)")
+
+# Record the measurements the selection was based on next to the model
+with open('best_model.json', 'w') as f:
+    json.dump({
+        'best_model': best_model_name,
+        'objective': args.objective or 'accuracy',
+        'latency_budget_us': args.latency_budget_us,
+        'candidates': {
+            name: {'accuracy': accuracies[name], **latencies[name]} for name in accuracies
+        },
+    }, f, indent=2)
+print("✅ Selection measurements saved as best_model.json")
+
+# Step 10: Save the fused inference pipeline (username features + scaler folded into the model)
+pipeline = pipelines[best_model_name]
+joblib.dump(pipeline, 'pipeline.pkl')
+save_artifact(pipeline, 'pipeline.artifact')
+print("✅ Inference pipeline saved as pipeline.pkl and pipeline.artifact")
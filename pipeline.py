@@ -0,0 +1,67 @@
+import numpy as np
+
+from scorer import export_scorer
+from features import model_matrix, username_feature_names
+
+# Form field names accepted in place of the training column names
+COLUMN_ALIASES = {
+    'num_followers': 'followers',
+    'num_following': 'following',
+    'posts_count': 'posts',
+    'account_age_days': 'account_age',
+}
+
+
+class InferencePipeline:
+    """Username feature extractor, scaler and estimator fused into one artifact
+
+    The StandardScaler fitted in model.py is folded into the exported scorer,
+    so raw profile columns go straight from one matrix into the model.
+    """
+
+    def __init__(self, numeric_columns, username_buckets, scorer):
+        self.numeric_columns = list(numeric_columns)
+        self.username_buckets = username_buckets  # 0 when the model has no username features
+        self.feature_names = (
+            username_feature_names(username_buckets) if username_buckets else []
+        ) + self.numeric_columns
+        self.scorer = scorer
+        self.classes_ = scorer.classes_
+
+    def transform(self, frame, dtype=np.float64):
+        """Fill the model matrix straight from the raw profile columns"""
+        # Only where the model uses the target column and not the alias itself
+        # (a model trained on account_age_days keeps that column)
+        renames = {
+            alias: column for alias, column in COLUMN_ALIASES.items()
+            if alias in frame.columns and column not in frame.columns
+            and column in self.numeric_columns and alias not in self.numeric_columns
+        }
+        if renames:
+            frame = frame.rename(columns=renames)
+        return model_matrix(frame, self.numeric_columns, self.username_buckets, dtype=dtype)
+
+    def as_matrix(self, X):
+        return self.transform(X) if hasattr(X, 'columns') else X
+
+    def predict(self, X):
+        return self.scorer.predict(self.as_matrix(X))
+
+    @property
+    def predict_proba(self):
+        # Raises AttributeError, like SVC itself, when the scorer has no probabilities
+        scorer_proba = self.scorer.predict_proba
+
+        def predict_proba(X):
+            return scorer_proba(self.as_matrix(X))
+        return predict_proba
+
+
+def build_pipeline(numeric_columns, scaler, model, username_buckets=0):
+    """Fuse the fitted scaler and estimator saved by model.py
+
+    The model's input columns must be the username features (when
+    username_buckets > 0) followed by numeric_columns, as built in model.py.
+    """
+    scorer = export_scorer(model).fold_scaler(scaler.mean_, scaler.scale_)
+    return InferencePipeline(numeric_columns, username_buckets, scorer)
@@ -1,9 +1,58 @@
-import pandas as pd
+import argparse
+import sys
+
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
 
-# Step 1: Load the dataset
-df = pd.read_csv('fake_profiles.csv')
+from dataset_cache import (load_splits, save_splits, read_manifest, write_manifest, reset_cache,
+                           append_splits, appended_since, fingerprint, hash_split, CACHE_DIR)
+from ingest import read_profiles, data_range
+
+parser = argparse.ArgumentParser(description="Split fake_profiles.csv into train/test sets")
+parser.add_argument('--force', action='store_true', help="rebuild the splits even if the cache is fresh")
+parser.add_argument('--incremental', action='store_true',
+                    help="only process rows appended since the last run, splitting by username hash")
+parser.add_argument('--chunksize', type=int, default=100000, help="rows per chunk in --incremental mode")
+args = parser.parse_args()
+
+# Incremental mode: rows are assigned to train/test by a stable hash of the
+# username instead of a random split, so each run only has to parse the bytes
+# appended to the CSV since the previous run and append them to the splits.
+if args.incremental:
+    manifest = read_manifest()
+    start, end = data_range('fake_profiles.csv')
+    rebuild = (args.force or manifest is None or manifest['split_method'] != 'hash'
+               or not appended_since('fake_profiles.csv', manifest))
+    if rebuild:
+        manifest = reset_cache('hash')
+        print("Building hash-split cache from all of fake_profiles.csv")
+    else:
+        start = manifest['offset']
+        print(f"Processing {end - start} new bytes of fake_profiles.csv")
+
+    new_rows = 0
+    for chunk in read_profiles('fake_profiles.csv', chunksize=args.chunksize, byte_range=(start, end)):
+        is_test = hash_split(chunk['username'].fillna('').to_numpy())
+        X, y = chunk.drop(columns='label'), chunk['label']
+        parts = {'X_train': X[~is_test], 'X_test': X[is_test], 'y_train': y[~is_test], 'y_test': y[is_test]}
+
+        append_splits(manifest, parts)
+        for name, part in parts.items():
+            part.to_csv(f"{name}.csv", index=False, mode='w' if rebuild else 'a', header=rebuild)
+        rebuild = False
+        new_rows += len(chunk)
+
+    write_manifest(fingerprint(manifest, 'fake_profiles.csv', end, full_hash=False))
+    print(f"✅ Added {new_rows} rows; training set size: {manifest['splits']['X_train']['rows']}, "
+          f"test set size: {manifest['splits']['X_test']['rows']}")
+    sys.exit(0)
+
+# Step 0: Skip all text parsing when the binary cache matches the current source file
+if not args.force and load_splits('fake_profiles.csv') is not None:
+    print(f"✅ {CACHE_DIR}/ is up to date with fake_profiles.csv, nothing to do")
+    sys.exit(0)
+
+# Step 1: Load the dataset (typed columns, labels mapped to 1 = fake / 0 = real)
+df = read_profiles('fake_profiles.csv')
 
 print("First 5 rows of the dataset:")
 print(df.head())
@@ -12,11 +61,7 @@ print(df.head())
 print("\nChecking for missing values:")
 print(df.isnull().sum())
 
-# Step 3: Encode the label column (if not already numeric)
-# In our dataset, label is already 0/1 — skip if so, otherwise:
-if df['label'].dtype == 'object':
-    label_encoder = LabelEncoder()
-    df['label'] = label_encoder.fit_transform(df['label'])
+# Step 3: Labels are already encoded as 0/1 by read_profiles
 
 # Step 4: Define features and target
 X = df.drop('label', axis=1)  # Features (input)
@@ -37,4 +82,8 @@ X_test.to_csv('X_test.csv', index=False)
 y_train.to_csv('y_train.csv', index=False)
 y_test.to_csv('y_test.csv', index=False)
 
-print("\nPreprocessing complete! Training and test data saved.")
\ No newline at end of file
+# Typed binary cache of the same splits, loaded zero-copy by model.py
+save_splits('fake_profiles.csv', X_train, X_test, y_train, y_test)
+print(f"✅ Binary split cache written to {CACHE_DIR}/")
+
+print("\nPreprocessing complete! Training and test data saved.")
\ No newline at end of file
@@ -0,0 +1,148 @@
+import time
+from collections import deque, defaultdict
+from threading import Condition, Event, Thread
+
+# Request scheduler for the profile scrapers in tests.py. Every platform
+# (as named by AdvancedFakeProfileDetector.detect_platform) gets a token
+# bucket: requests go out at its sustained rate, with short bursts up to its
+# capacity, and pause entirely after the platform answers 429. An optional
+# global bucket caps the total across platforms; platforms waiting for it
+# are served round-robin so one big batch cannot starve the others.
+# Interactive requests (the GUI) take a platform's next token ahead of any
+# queued bulk ones, and are granted first when the global bucket refills.
+
+# (requests per second, burst capacity) per platform
+DEFAULT_RATES = {
+    'twitter': (1.0, 5),
+    'instagram': (0.5, 3),
+    'facebook': (0.5, 3),
+    'linkedin': (0.2, 2),
+    'other': (2.0, 10),
+}
+LANES = ['interactive', 'bulk']
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def refill(self, now):
+        # Nothing accrues while paused
+        since = max(self.updated, min(self.paused_until, now))
+        self.tokens = min(self.capacity, self.tokens + (now - since) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now):
+        """Seconds until a token is available (0 if one is available now)"""
+        self.refill(now)
+        if now < self.paused_until:
+            return self.paused_until - now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        self.tokens -= 1
+
+    def pause(self, now, seconds):
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = 0
+
+
+class PlatformScheduler:
+    """Grant fetches per platform at configured rates, fairly and by priority
+
+    acquire() blocks the calling thread until its request may be sent.
+    Waiting requests are queued per platform in an interactive and a bulk
+    lane; a dispatcher thread grants them as tokens become available.
+    """
+
+    def __init__(self, rates=None, global_rate=None, default_platform='other', backoff_seconds=60.0,
+                 max_backoff_seconds=600.0):
+        rates = {**DEFAULT_RATES, **(rates or {})}
+        self.buckets = {platform: TokenBucket(rate, burst) for platform, (rate, burst) in rates.items()}
+        self.global_bucket = TokenBucket(*global_rate) if global_rate else None
+        self.default_platform = default_platform
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+        self.condition = Condition()
+        self.queues = {lane: defaultdict(deque) for lane in LANES}
+        self.next_platform = 0  # round-robin position over self.buckets
+        self.granted = defaultdict(int)
+
+        self.dispatcher = Thread(target=self.dispatch, daemon=True)
+        self.dispatcher.start()
+
+    def platform_key(self, platform):
+        return platform if platform in self.buckets else self.default_platform
+
+    def acquire(self, platform, priority='bulk'):
+        """Block until a request to platform may be sent; returns the seconds waited"""
+        if priority not in LANES:
+            raise ValueError(f"Unknown priority {priority!r} (expected one of {', '.join(LANES)})")
+        granted = Event()
+        start = time.monotonic()
+        with self.condition:
+            self.queues[priority][self.platform_key(platform)].append(granted)
+            self.condition.notify()
+        granted.wait()
+        return time.monotonic() - start
+
+    def backoff(self, platform, seconds=None):
+        """Stop sending to platform for a while (at most max_backoff_seconds), e.g. after a 429"""
+        seconds = min(seconds or self.backoff_seconds, self.max_backoff_seconds)
+        with self.condition:
+            self.buckets[self.platform_key(platform)].pause(time.monotonic(), seconds)
+
+    def dispatch(self):
+        with self.condition:
+            while True:
+                timeout = self.grant_ready(time.monotonic())
+                self.condition.wait(timeout)
+
+    def grant_ready(self, now):
+        """Grant every request that can go now; returns seconds until the next one could (None = idle)"""
+        platforms = list(self.buckets)
+        next_wait = None
+        for lane in LANES:
+            # Round-robin over the platforms with waiting requests in this lane
+            progress = True
+            while progress:
+                progress = False
+                for offset in range(len(platforms)):
+                    index = (self.next_platform + offset) % len(platforms)
+                    platform = platforms[index]
+                    queue = self.queues[lane][platform]
+                    if not queue:
+                        continue
+                    if lane == 'bulk' and self.queues['interactive'][platform]:
+                        # This platform's next token belongs to its interactive lane
+                        continue
+
+                    wait = self.buckets[platform].wait_time(now)
+                    if self.global_bucket is not None:
+                        wait = max(wait, self.global_bucket.wait_time(now))
+                    if wait > 0:
+                        next_wait = wait if next_wait is None else min(next_wait, wait)
+                        continue
+
+                    self.buckets[platform].take()
+                    if self.global_bucket is not None:
+                        self.global_bucket.take()
+                    queue.popleft().set()
+                    self.granted[lane, platform] += 1
+                    self.next_platform = (index + 1) % len(platforms)
+                    progress = True
+                    break
+        return next_wait
+
+    def stats(self):
+        with self.condition:
+            return {
+                'waiting': {lane: {platform: len(queue) for platform, queue in queues.items() if queue}
+                            for lane, queues in self.queues.items()},
+                'granted': {f"{lane}/{platform}": count for (lane, platform), count in self.granted.items()},
+            }
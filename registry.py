@@ -0,0 +1,113 @@
+import os
+import time
+from collections import namedtuple
+from threading import Event, Lock, Thread
+
+from artifact import HEADER_FILE, artifact_version, load_model, resolve_model_path
+
+# One immutable (model, version) pair. Requests read the registry's current
+# snapshot once and use it throughout, so a swap mid-request never mixes models.
+LoadedModel = namedtuple('LoadedModel', ['model', 'version', 'path', 'loaded_at'])
+
+
+def file_stamp(path):
+    """Identity of the published model file; changes whenever it is replaced"""
+    if os.path.isdir(path):
+        path = os.path.join(path, HEADER_FILE)
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def model_version(path, stamp):
+    """Artifact directories carry their version; pickles are versioned by modification time"""
+    if os.path.isdir(path):
+        return artifact_version(path) or f"v{stamp[1]}"
+    return f"v{stamp[1]}"
+
+
+class ModelRegistry:
+    """Serve a model that can be replaced on disk without restarting the process
+
+    Readers take `registry.current`, a plain attribute read that never blocks.
+    New models are loaded off the request path (by the watcher thread or by
+    reload()) and published by rebinding `current`, read-copy-update style:
+    requests already holding the old snapshot finish with it, and it is freed
+    once the last of them drops its reference.
+    """
+
+    def __init__(self, path=None, poll_seconds=0.0):
+        self.path = resolve_model_path(path)
+        self.reload_lock = Lock()
+        self.last_error = None
+        self.swaps = 0
+        self.stamp = file_stamp(self.path)
+        self.current = self.load(self.stamp)
+
+        self.poll_seconds = poll_seconds
+        self.stopped = Event()
+        self.watcher = None
+        if poll_seconds > 0:
+            self.start_watcher()
+            # Threads do not survive fork(): a prefork server (see wsgi.py) that
+            # loaded the model in its master gets a fresh watcher in every worker
+            if hasattr(os, 'register_at_fork'):
+                os.register_at_fork(after_in_child=self.after_fork)
+
+    def start_watcher(self):
+        self.watcher = Thread(target=self.watch, daemon=True)
+        self.watcher.start()
+
+    def after_fork(self):
+        # The parent's lock may have been held by a thread that does not exist here
+        self.reload_lock = Lock()
+        if not self.stopped.is_set():
+            self.start_watcher()
+
+    def load(self, stamp):
+        return LoadedModel(load_model(self.path), model_version(self.path, stamp), self.path, time.time())
+
+    def reload(self, force=False):
+        """Load the model again if the file changed (or always, with force) and swap it in
+
+        Returns the current snapshot. A failed load leaves the previous model
+        serving and is re-raised to the caller.
+        """
+        with self.reload_lock:
+            try:
+                stamp = file_stamp(self.path)
+                if not force and stamp == self.stamp:
+                    return self.current
+                loaded = self.load(stamp)
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                raise
+
+            self.stamp = stamp
+            self.current = loaded
+            self.last_error = None
+            self.swaps += 1
+            return loaded
+
+    def watch(self):
+        while not self.stopped.wait(self.poll_seconds):
+            try:
+                self.reload()
+            except Exception:
+                # Typically a model caught mid-publish by a non-atomic writer;
+                # the next poll tries again, last_error reports it meanwhile
+                pass
+
+    def stop(self):
+        self.stopped.set()
+
+    def status(self):
+        current = self.current
+        return {
+            'version': current.version,
+            'path': current.path,
+            'model': type(current.model).__name__,
+            'loaded_at': current.loaded_at,
+            'swaps': self.swaps,
+            'poll_seconds': self.poll_seconds,
+            'last_error': self.last_error,
+        }
@@ -0,0 +1,168 @@
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from threading import Lock
+
+# Bounded cache for the detector's analysis results (test.py, tests.py). An
+# in-memory LRU tier caps both the number of entries and their total size,
+# every entry expires after its TTL so verdicts are eventually recomputed,
+# and an optional SQLite tier keeps results across restarts. Values must be
+# JSON-serializable, which also gives the size used for the byte limit.
+#
+#     cache = ResultCache(max_entries=10000, ttl=86400, store=SQLiteStore('results.db'))
+#     cache.set(key, results)
+#     cache.get(key)  # None on a miss or an expired entry
+
+
+class SQLiteStore:
+    """On-disk tier: key -> (JSON value, expiry time), pruned to max_entries least recently written"""
+
+    def __init__(self, path, max_entries=1000000):
+        self.max_entries = max_entries
+        self.lock = Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, written_at REAL NOT NULL)'
+        )
+        self.connection.execute('CREATE INDEX IF NOT EXISTS results_written ON results (written_at)')
+        self.writes = 0
+
+    def get(self, key):
+        """(JSON value, expires_at), or None"""
+        with self.lock:
+            return self.connection.execute(
+                'SELECT value, expires_at FROM results WHERE key = ?', (key,)
+            ).fetchone()
+
+    def set(self, key, value, expires_at):
+        with self.lock:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO results (key, value, expires_at, written_at) VALUES (?, ?, ?, ?)',
+                (key, value, expires_at, time.time()),
+            )
+            self.writes += 1
+            # Prune now and then rather than on every write
+            if self.writes % 1000 == 0:
+                self.prune()
+
+    def delete(self, key):
+        with self.lock:
+            self.connection.execute('DELETE FROM results WHERE key = ?', (key,))
+
+    def prune(self):
+        self.connection.execute('DELETE FROM results WHERE expires_at <= ?', (time.time(),))
+        self.connection.execute(
+            'DELETE FROM results WHERE key IN ('
+            'SELECT key FROM results ORDER BY written_at DESC LIMIT -1 OFFSET ?)', (self.max_entries,)
+        )
+
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+class ResultCache:
+    """Thread-safe LRU cache with entry and byte limits, per-entry TTL and an optional backing store
+
+    store is any object with get(key) -> (json, expires_at) | None,
+    set(key, json, expires_at) and delete(key), such as SQLiteStore. Memory
+    misses fall through to it, and hits there are promoted back into memory.
+    """
+
+    def __init__(self, max_entries=10000, max_bytes=64 * 1024 * 1024, ttl=24 * 3600, store=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.store = store
+
+        self.lock = Lock()
+        self.entries = OrderedDict()  # key -> (value, expires_at, size), least recently used first
+        self.bytes = 0
+        self.counters = dict.fromkeys(['hits', 'store_hits', 'misses', 'expired', 'evictions'], 0)
+
+    def get(self, key):
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self.entries.move_to_end(key)
+                    self.counters['hits'] += 1
+                    return entry[0]
+                self.remove(key)
+                self.counters['expired'] += 1
+
+        if self.store is not None:
+            row = self.store.get(key)
+            if row is not None:
+                encoded, expires_at = row
+                if expires_at > now:
+                    value = json.loads(encoded)
+                    with self.lock:
+                        self.counters['store_hits'] += 1
+                        self.insert(key, value, expires_at, len(encoded))
+                    return value
+                self.store.delete(key)
+                with self.lock:
+                    self.counters['expired'] += 1
+
+        with self.lock:
+            self.counters['misses'] += 1
+        return None
+
+    def set(self, key, value, ttl=None):
+        encoded = json.dumps(value)
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self.lock:
+            self.insert(key, value, expires_at, len(encoded))
+        if self.store is not None:
+            self.store.set(key, encoded, expires_at)
+
+    def insert(self, key, value, expires_at, size):
+        if key in self.entries:
+            self.remove(key)
+        if size > self.max_bytes:
+            return  # would evict everything else and still not fit
+        self.entries[key] = (value, expires_at, size)
+        self.bytes += size
+        while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+            self.remove(next(iter(self.entries)))
+            self.counters['evictions'] += 1
+
+    def remove(self, key):
+        _, _, size = self.entries.pop(key)
+        self.bytes -= size
+
+    def __len__(self):
+        return len(self.entries)
+
+    def stats(self):
+        with self.lock:
+            lookups = self.counters['hits'] + self.counters['store_hits'] + self.counters['misses']
+            return {
+                **self.counters,
+                'hit_rate': (self.counters['hits'] + self.counters['store_hits']) / lookups if lookups else 0.0,
+                'entries': len(self.entries),
+                'bytes': self.bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+
+def result_cache_from_env():
+    """The detectors' cache; RESULT_CACHE_PATH enables the SQLite tier, limits are also configurable"""
+    path = os.environ.get('RESULT_CACHE_PATH')
+    return ResultCache(
+        max_entries=int(os.environ.get('RESULT_CACHE_MAX_ENTRIES', 10000)),
+        max_bytes=int(os.environ.get('RESULT_CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+        ttl=float(os.environ.get('RESULT_CACHE_TTL', 24 * 3600)),
+        store=SQLiteStore(path) if path else None,
+    )
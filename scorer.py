@@ -0,0 +1,177 @@
+import numpy as np
+
+
+class LinearScorer:
+    """Logistic regression as a dot product plus sigmoid"""
+
+    def __init__(self, coef, intercept, classes):
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64)
+        self.intercept = np.ascontiguousarray(intercept, dtype=np.float64)
+        self.classes_ = classes
+
+    def decision_function(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        return (X @ self.coef.T + self.intercept).ravel()
+
+    def predict(self, X):
+        return self.classes_[(self.decision_function(X) > 0).astype(int)]
+
+    def fold_scaler(self, mean, scale):
+        """Absorb a StandardScaler so raw features can be scored directly"""
+        self.coef = self.coef / scale
+        self.intercept = self.intercept - self.coef @ mean
+        return self
+
+    def predict_proba(self, X):
+        prob = 1.0 / (1.0 + np.exp(-self.decision_function(X)))
+        return np.column_stack([1 - prob, prob])
+
+
+class TreeEnsembleScorer:
+    """Decision tree or random forest flattened into shared node arrays
+
+    Every tree's nodes are stored back to back; roots holds the offset of each
+    tree. All trees are walked together one level at a time, so scoring costs
+    max_depth vectorized steps regardless of the number of trees.
+    """
+
+    # Scaler applied to the input before the float32 cast (identity unless
+    # fold_scaler was called; also the default for artifacts saved without one)
+    input_mean = 0.0
+    input_scale = 1.0
+
+    def __init__(self, trees, classes):
+        self.classes_ = classes
+        self.input_mean = np.zeros(trees[0].n_features)
+        self.input_scale = np.ones(trees[0].n_features)
+
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        self.max_depth = 0
+        for tree in trees:
+            is_leaf = tree.children_left == -1
+            roots.append(offset)
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(tree.threshold)
+            # Leaves point at themselves so extra steps are no-ops
+            node_ids = np.arange(tree.node_count) + offset
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left + offset))
+            rights.append(np.where(is_leaf, node_ids, tree.children_right + offset))
+
+            # Per-tree class probabilities, normalized the way sklearn does
+            value = tree.value[:, 0, :len(classes)].astype(np.float64)
+            normalizer = value.sum(axis=1)[:, None]
+            normalizer[normalizer == 0.0] = 1.0
+            values.append(value / normalizer)
+
+            offset += tree.node_count
+            self.max_depth = max(self.max_depth, tree.max_depth)
+
+        self.feature = np.concatenate(features).astype(np.intp)
+        self.threshold = np.concatenate(thresholds)
+        self.left = np.concatenate(lefts).astype(np.intp)
+        self.right = np.concatenate(rights).astype(np.intp)
+        self.value = np.concatenate(values)
+        self.roots = np.array(roots, dtype=np.intp)
+
+    def fold_scaler(self, mean, scale):
+        """Scale raw features inside the scorer
+
+        The thresholds are not moved to raw units instead: sklearn compares
+        the float32 of the scaled value, and threshold * scale + mean does not
+        round the same way, which flips rows that sit right on a split.
+        """
+        self.input_mean = np.asarray(mean, dtype=np.float64)
+        self.input_scale = np.asarray(scale, dtype=np.float64)
+        return self
+
+    def apply(self, X):
+        """Leaf index in the flattened arrays for every (sample, tree) pair"""
+        # Scaled exactly like StandardScaler.transform; sklearn's trees then
+        # compare float32 inputs against float64 thresholds
+        X = ((np.asarray(X, dtype=np.float64) - self.input_mean) / self.input_scale).astype(np.float32)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], len(self.roots)))
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+
+    def predict_proba(self, X):
+        # Summing over the tree axis adds trees in order, matching sklearn's accumulation
+        return self.value[self.apply(X)].sum(axis=1) / len(self.roots)
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1))
+
+
+class RBFScorer:
+    """RBF-kernel SVC evaluated directly against its support vectors
+
+    Squared distances use the expansion |x|^2 + |sv|^2 - 2 x.sv (all weighted
+    by feature_weights), one block of rows at a time, so memory is bounded by
+    block_rows x n_support_vectors however many rows are scored.
+    """
+
+    block_rows = 512
+
+    def __init__(self, support_vectors, dual_coef, intercept, gamma, classes):
+        self.support_vectors = np.ascontiguousarray(support_vectors, dtype=np.float64)
+        self.dual_coef = np.ascontiguousarray(dual_coef, dtype=np.float64).ravel()
+        self.intercept = float(np.ravel(intercept)[0])
+        self.gamma = float(gamma)
+        self.feature_weights = np.ones(self.support_vectors.shape[1])
+        self.classes_ = classes
+
+    def fold_scaler(self, mean, scale):
+        """Map support vectors to raw units and weight each feature by 1 / scale**2"""
+        self.support_vectors = self.support_vectors * scale + mean
+        self.feature_weights = self.feature_weights / (scale * scale)
+        return self
+
+    def decision_function(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        weighted_support = self.support_vectors * self.feature_weights
+        support_norms = (weighted_support * self.support_vectors).sum(axis=1)
+
+        scores = np.empty(X.shape[0])
+        for start in range(0, X.shape[0], self.block_rows):
+            block = X[start:start + self.block_rows]
+            distances = block @ weighted_support.T
+            distances *= -2
+            distances += (block * block * self.feature_weights).sum(axis=1)[:, None]
+            distances += support_norms
+            # Rounding can leave tiny negatives where a row coincides with a support vector
+            np.maximum(distances, 0, out=distances)
+            distances *= -self.gamma
+            scores[start:start + self.block_rows] = np.exp(distances, out=distances) @ self.dual_coef
+        return scores + self.intercept
+
+    def predict(self, X):
+        return self.classes_[(self.decision_function(X) >= 0).astype(int)]
+
+
+def export_scorer(model):
+    """Turn a fitted estimator saved by model.py into a NumPy-only scorer"""
+    # Imported here so loading an exported scorer does not pull in sklearn
+    from sklearn.linear_model import LogisticRegression, SGDClassifier
+    from sklearn.tree import DecisionTreeClassifier
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.svm import SVC
+
+    classes = np.asarray(model.classes_)
+    if len(classes) != 2:
+        raise ValueError("Only binary classifiers can be exported")
+
+    is_logistic_sgd = isinstance(model, SGDClassifier) and model.loss == 'log_loss'
+    if isinstance(model, LogisticRegression) or is_logistic_sgd:
+        return LinearScorer(model.coef_, model.intercept_, classes)
+    if isinstance(model, DecisionTreeClassifier):
+        return TreeEnsembleScorer([model.tree_], classes)
+    if isinstance(model, RandomForestClassifier):
+        return TreeEnsembleScorer([estimator.tree_ for estimator in model.estimators_], classes)
+    if isinstance(model, SVC) and model.kernel == 'rbf':
+        return RBFScorer(model.support_vectors_, model.dual_coef_, model.intercept_,
+                         model._gamma, classes)
+    raise ValueError(f"Cannot export {type(model).__name__}")
+
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+from sklearn.base import clone
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingGridSearchCV
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.svm import SVC
+
+from training import measure_latency
+
+# Hyperparameter grids for the four model families in model.py
+SEARCH_SPACES = {
+    "Logistic Regression": (LogisticRegression(max_iter=1000), {
+        'C': [0.01, 0.1, 1.0, 10.0, 100.0],
+    }),
+    "Decision Tree": (DecisionTreeClassifier(random_state=42), {
+        'max_depth': [3, 5, 8, 12, None],
+        'min_samples_leaf': [1, 5, 20],
+    }),
+    "Random Forest": (RandomForestClassifier(random_state=42), {
+        'n_estimators': [50, 100, 200],
+        'max_depth': [5, 10, None],
+    }),
+    "SVM": (SVC(kernel='rbf'), {
+        'C': [0.1, 1.0, 10.0],
+        'gamma': ['scale', 0.01, 0.1, 1.0],
+    }),
+}
+
+
+def search_family(estimator, grid, X, y, cv=5, n_jobs=-1, factor=3):
+    """Successive-halving grid search: every config is scored on a small subsample
+    and only the best 1/factor move on to a larger one, up to the full training set"""
+    search = HalvingGridSearchCV(
+        estimator, grid, cv=cv, factor=factor, scoring='accuracy',
+        n_jobs=n_jobs, random_state=42, refit=False
+    )
+    search.fit(X, y)
+
+    results = pd.DataFrame(search.cv_results_)
+    final = results[results['iter'] == results['iter'].max()]
+    return final[['params', 'mean_test_score', 'std_test_score', 'n_resources']]
+
+
+def run_search(X_train, y_train, X_latency, cv=5, n_jobs=-1, top_k=3):
+    """Search every family and rank the surviving configs by CV accuracy and latency
+
+    The top_k configs per family are refitted on the full training set and
+    timed on X_latency. Returns a DataFrame sorted by accuracy (ties broken by
+    single-row latency) with a 'pareto' column marking configs no other config
+    beats on both accuracy and latency.
+    """
+    rows = []
+    for family, (estimator, grid) in SEARCH_SPACES.items():
+        survivors = search_family(estimator, grid, X_train, y_train, cv=cv, n_jobs=n_jobs)
+        survivors = survivors.sort_values('mean_test_score', ascending=False).head(top_k)
+
+        for _, result in survivors.iterrows():
+            model = clone(estimator).set_params(**result['params']).fit(X_train, y_train)
+            latency = measure_latency(model, X_latency)
+            rows.append({
+                'family': family,
+                'params': result['params'],
+                'cv_accuracy': result['mean_test_score'],
+                'cv_std': result['std_test_score'],
+                'single_row_us': latency['single_row_us'],
+                'batch_row_us': latency['batch_row_us'],
+                'model': model,
+            })
+
+    ranking = pd.DataFrame(rows).sort_values(
+        ['cv_accuracy', 'single_row_us'], ascending=[False, True]
+    ).reset_index(drop=True)
+
+    accuracy = ranking['cv_accuracy'].to_numpy()
+    latency = ranking['single_row_us'].to_numpy()
+    ranking['pareto'] = [
+        not np.any((accuracy >= a) & (latency <= t) & ((accuracy > a) | (latency < t)))
+        for a, t in zip(accuracy, latency)
+    ]
+    return ranking
@@ -9,6 +9,7 @@ import time
 import random
 from datetime import datetime, timedelta
 import hashlib
+from result_cache import result_cache_from_env
 
 class AdvancedFakeProfileDetectorGUI:
     def __init__(self, root):
@@ -329,7 +330,8 @@ class AdvancedFakeProfileDetector:
             'instagram': r'instagram\.com',
             'linkedin': r'linkedin\.com'
         }
-        self.result_cache = {}
+        # Bounded LRU with per-entry TTL; RESULT_CACHE_PATH adds a persistent SQLite tier
+        self.result_cache = result_cache_from_env()
         # More realistic base probabilities (10% chance an account is fake)
         self.fake_account_probability = 0.1
     
@@ -337,8 +339,9 @@ class AdvancedFakeProfileDetector:
         """More realistic profile analysis with mixed results"""
         url_hash = hashlib.md5(profile_url.encode()).hexdigest()
         
-        if url_hash in self.result_cache:
-            return self.result_cache[url_hash]
+        cached = self.result_cache.get(url_hash)
+        if cached is not None:
+            return cached
             
         results = {
             'profile_url': profile_url,
@@ -403,7 +406,7 @@ class AdvancedFakeProfileDetector:
             self.determine_verdict(results)
             
             # Cache the result
-            self.result_cache[url_hash] = results
+            self.result_cache.set(url_hash, results)
             
             return results
             
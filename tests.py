@@ -1,19 +1,24 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import requests
+import os
 from bs4 import BeautifulSoup
 import re
 from urllib.parse import urlparse, parse_qs
 from threading import Thread
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import deque, Counter
 import time
 import random
 from datetime import datetime, timedelta
 import hashlib
+from result_cache import result_cache_from_env
 import json
 from PIL import Image
 import io
 import pytz
 from dateutil.parser import parse
+from http_pool import PooledSession, SERVER_ERROR_STATUSES
+from rate_limit import PlatformScheduler
 
 class AdvancedFakeProfileDetectorGUI:
     def __init__(self, root):
@@ -326,7 +331,8 @@ class AdvancedFakeProfileDetectorGUI:
         self.analyze_btn.config(state=tk.NORMAL)
 
 class AdvancedFakeProfileDetector:
-    def __init__(self):
+    def __init__(self, fake_name_patterns=None, fake_indicators=None):
+        """fake_name_patterns and fake_indicators are loaded from their JSON files unless given"""
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
@@ -336,24 +342,50 @@ class AdvancedFakeProfileDetector:
             'instagram': r'instagram\.com',
             'linkedin': r'linkedin\.com'
         }
-        self.result_cache = {}
+        # Keep-alive connections shared by every fetch, with per-host limits and
+        # retries. 429 is not retried here: check_rate_limited pauses the
+        # platform in the scheduler instead of the session sleeping on it
+        self.http = PooledSession(headers=self.headers, retry_statuses=SERVER_ERROR_STATUSES)
+        self.http.session.hooks['response'].append(self.check_rate_limited)
+        # Per-platform request rates; GUI lookups are served ahead of bulk jobs
+        self.scheduler = PlatformScheduler()
+        # Bounded LRU with per-entry TTL; RESULT_CACHE_PATH adds a persistent SQLite tier
+        self.result_cache = result_cache_from_env()
+        # Profiles analyzed at once per platform by analyze_profiles; platforms
+        # not listed share the 'other' limit
+        self.platform_concurrency = {
+            'facebook': 4,
+            'twitter': 4,
+            'instagram': 4,
+            'linkedin': 2,
+            'other': 8
+        }
         # Realistic base probabilities (30% chance an account is fake)
         self.fake_account_probability = 0.3
         
         # Load common fake name patterns
-        with open('fake_name_patterns.json', 'r') as f:
-            self.fake_name_patterns = json.load(f)
+        if fake_name_patterns is None:
+            with open('fake_name_patterns.json', 'r') as f:
+                fake_name_patterns = json.load(f)
+        self.fake_name_patterns = fake_name_patterns
         
         # Load common fake profile indicators
-        with open('fake_profile_indicators.json', 'r') as f:
-            self.fake_indicators = json.load(f)
+        if fake_indicators is None:
+            with open('fake_profile_indicators.json', 'r') as f:
+                fake_indicators = json.load(f)
+        self.fake_indicators = fake_indicators
     
-    def analyze_profile(self, profile_url, platform="auto"):
-        """Analyze a social media profile with real-world data"""
+    def analyze_profile(self, profile_url, platform="auto", priority="interactive"):
+        """Analyze a social media profile with real-world data
+
+        priority is the scheduler lane for the profile fetch: 'interactive'
+        for a user waiting on the result, 'bulk' for batch jobs.
+        """
         url_hash = hashlib.md5(profile_url.encode()).hexdigest()
         
-        if url_hash in self.result_cache:
-            return self.result_cache[url_hash]
+        cached = self.result_cache.get(url_hash)
+        if cached is not None:
+            return cached
             
         results = {
             'profile_url': profile_url,
@@ -380,7 +412,7 @@ class AdvancedFakeProfileDetector:
             results['platform'] = self.detect_platform(profile_url, platform)
             
             # Try to fetch actual profile data
-            profile_data = self.fetch_profile_data(profile_url, results['platform'])
+            profile_data = self.fetch_profile_data(profile_url, results['platform'], priority)
             
             if profile_data:
                 # Analyze based on real data
@@ -396,7 +428,7 @@ class AdvancedFakeProfileDetector:
             self.determine_verdict(results)
             
             # Cache the result
-            self.result_cache[url_hash] = results
+            self.result_cache.set(url_hash, results)
             
             return results
             
@@ -410,9 +442,103 @@ class AdvancedFakeProfileDetector:
             results['recommendation'] = 'Analysis incomplete - verify manually'
             return results
     
-    def fetch_profile_data(self, profile_url, platform):
+    def analyze_profiles(self, urls, platform="auto", max_workers=16, platform_limits=None):
+        """Analyze many profiles concurrently, yielding (index, results) as each one finishes
+
+        urls is any iterable of URLs or the path of a file with one URL per
+        line; index is the URL's position in it. At most max_workers profiles
+        are analyzed at once, and no more per platform than
+        self.platform_concurrency (overridden by platform_limits) allows. URLs
+        are read lazily and at most 16 * max_workers are queued, so
+        arbitrarily long lists run in bounded memory.
+        """
+        limits = {**self.platform_concurrency, **(platform_limits or {})}
+        source = self.iter_profile_urls(urls)
+        lookahead = 4  # URLs queued per platform, as a multiple of its limit
+        max_queued = 16 * max_workers
+        queued = {}  # platform -> deque of (index, url) waiting for a free slot
+        queued_count = 0
+        held = None  # (index, url, platform) read but not queued yet
+        running = Counter()
+        in_flight = {}  # future -> (index, platform)
+        exhausted = False
+
+        def limit_of(name):
+            return max(limits.get(name, limits['other']), 1)
+
+        def can_start():
+            return len(in_flight) < max_workers and any(
+                waiting and running[name] < limit_of(name) for name, waiting in queued.items()
+            )
+
+        def start_queued(pool):
+            # Start queued profiles on every platform that is under its limit
+            nonlocal queued_count
+            for name, waiting in queued.items():
+                while waiting and running[name] < limit_of(name) and len(in_flight) < max_workers:
+                    index, url = waiting.popleft()
+                    queued_count -= 1
+                    running[name] += 1
+                    in_flight[pool.submit(self.analyze_profile, url, platform, 'bulk')] = (index, name)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while True:
+                start_queued(pool)
+                # Read ahead so platforms with free slots have work while others are saturated
+                while not exhausted:
+                    if held is None:
+                        try:
+                            index, url = next(source)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        held = (index, url, self.detect_platform(url, platform))
+                    index, url, name = held
+                    waiting = queued.setdefault(name, deque())
+                    if len(waiting) >= limit_of(name) * lookahead:
+                        # This platform is backed up: read past it only while an idle
+                        # worker has nothing to start, and never beyond max_queued
+                        if can_start() or len(in_flight) >= max_workers or queued_count >= max_queued:
+                            break
+                    waiting.append((index, url))
+                    queued_count += 1
+                    held = None
+
+                start_queued(pool)
+                if not in_flight:
+                    return
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, name = in_flight.pop(future)
+                    running[name] -= 1
+                    yield index, future.result()
+
+    def iter_profile_urls(self, urls):
+        """(index, URL) from an iterable, or from a file (one per line, # comments) when given a path
+
+        index counts every item or line, including the blank and comment
+        lines that are skipped, so results map back to the input.
+        """
+        if isinstance(urls, (str, os.PathLike)):
+            with open(urls, 'r') as f:
+                yield from self.iter_profile_urls(f)
+            return
+
+        for index, url in enumerate(urls):
+            url = url.strip()
+            if not url or url.startswith('#'):
+                continue
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+            yield index, url
+
+    def fetch_profile_data(self, profile_url, platform, priority="interactive"):
         """Attempt to fetch actual profile data from the platform"""
         try:
+            if platform in ('twitter', 'instagram', 'facebook', 'linkedin'):
+                # Wait for the platform's rate limit before sending anything
+                self.scheduler.acquire(platform, priority)
             if platform == 'twitter':
                 return self.fetch_twitter_data(profile_url)
             elif platform == 'instagram':
@@ -425,14 +551,28 @@ class AdvancedFakeProfileDetector:
         except Exception:
             return None
     
+    def check_rate_limited(self, response, *args, **kwargs):
+        """Response hook: pause a platform in the scheduler as soon as it answers 429"""
+        if response.status_code == 429:
+            platform = self.detect_platform(response.url, 'auto')
+            if platform != 'other':
+                retry_after = response.headers.get('Retry-After', '')
+                self.scheduler.backoff(platform, float(retry_after) if retry_after.isdigit() else None)
+    
     def fetch_twitter_data(self, profile_url):
         """Fetch Twitter profile data"""
         try:
-            response = requests.get(profile_url, headers=self.headers, timeout=10)
+            response = self.http.get(profile_url, timeout=10)
             if response.status_code != 200:
                 return None
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
+            return self.parse_twitter_page(response.text)
+        except Exception:
+            return None
+    
+    def parse_twitter_page(self, html):
+        """Extract Twitter profile data from the HTML of a profile page"""
+        try:
+            soup = BeautifulSoup(html, 'html.parser')
             
             # Extract account creation date from the page
             script_tags = soup.find_all('script', {'type': 'application/ld+json'})
@@ -444,7 +584,7 @@ class AdvancedFakeProfileDetector:
                         if date_created:
                             return {
                                 'account_created': parse(date_created),
-                                'is_private': 'protected' in response.text.lower(),
+                                'is_private': 'protected' in html.lower(),
                                 'post_count': self.extract_twitter_post_count(soup),
                                 'follower_count': self.extract_twitter_follower_count(soup),
                                 'following_count': self.extract_twitter_following_count(soup),
@@ -515,11 +655,17 @@ class AdvancedFakeProfileDetector:
     def fetch_instagram_data(self, profile_url):
         """Fetch Instagram profile data"""
         try:
-            response = requests.get(profile_url, headers=self.headers, timeout=10)
+            response = self.http.get(profile_url, timeout=10)
             if response.status_code != 200:
                 return None
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
+            return self.parse_instagram_page(response.text)
+        except Exception:
+            return None
+    
+    def parse_instagram_page(self, html):
+        """Extract Instagram profile data from the HTML of a profile page"""
+        try:
+            soup = BeautifulSoup(html, 'html.parser')
             
             # Instagram data is often in JSON within script tags
             script_tags = soup.find_all('script')
@@ -549,14 +695,20 @@ class AdvancedFakeProfileDetector:
     def fetch_facebook_data(self, profile_url):
         """Fetch Facebook profile data (limited due to restrictions)"""
         try:
-            response = requests.get(profile_url, headers=self.headers, timeout=10)
+            response = self.http.get(profile_url, timeout=10)
             if response.status_code != 200:
                 return None
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
+            return self.parse_facebook_page(response.text)
+        except Exception:
+            return None
+    
+    def parse_facebook_page(self, html):
+        """Extract Facebook profile data from the HTML of a profile page"""
+        try:
+            soup = BeautifulSoup(html, 'html.parser')
             
             # Facebook makes this difficult - we'll look for basic indicators
-            is_private = 'This content isn\'t available right now' in response.text
+            is_private = 'This content isn\'t available right now' in html
             username = self.extract_facebook_username(soup)
             profile_image = self.extract_facebook_profile_image(soup)
             
@@ -591,11 +743,17 @@ class AdvancedFakeProfileDetector:
     def fetch_linkedin_data(self, profile_url):
         """Fetch LinkedIn profile data (limited due to restrictions)"""
         try:
-            response = requests.get(profile_url, headers=self.headers, timeout=10)
+            response = self.http.get(profile_url, timeout=10)
             if response.status_code != 200:
                 return None
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
+            return self.parse_linkedin_page(response.text)
+        except Exception:
+            return None
+    
+    def parse_linkedin_page(self, html):
+        """Extract LinkedIn profile data from the HTML of a profile page"""
+        try:
+            soup = BeautifulSoup(html, 'html.parser')
             
             # LinkedIn data is often in JSON-LD format
             script_tags = soup.find_all('script', {'type': 'application/ld+json'})
@@ -752,7 +910,7 @@ class AdvancedFakeProfileDetector:
     def analyze_profile_image(self, results, image_url):
         """Analyze the profile image for signs of being fake"""
         try:
-            response = requests.get(image_url, headers=self.headers, timeout=10)
+            response = self.http.get(image_url, timeout=10)
             if response.status_code == 200:
                 img = Image.open(io.BytesIO(response.content))
                 
@@ -769,202 +927,203 @@ class AdvancedFakeProfileDetector:
                     results['score'] += 10
                     results['indicators'].append({
                         'indicator': "Low-quality or non-standard profile photo",
-                        'severity
-            # Check for default/stock images
-            img_hash = hashlib.md5(response.content).hexdigest()
-            if img_hash in self.fake_indicators.get('common_default_images', []):
-                results['image_authenticity'] = "Default/stock profile photo"
-                results['score'] += 20
-                results['indicators'].append({
-                    'indicator': "Default/stock profile photo detected",
-                    'severity': 'high'
-                })
+                        'severity': 'medium'
+                    })
+                # Check for default/stock images
+                img_hash = hashlib.md5(response.content).hexdigest()
+                if img_hash in self.fake_indicators.get('common_default_images', []):
+                    results['image_authenticity'] = "Default/stock profile photo"
+                    results['score'] += 20
+                    results['indicators'].append({
+                        'indicator': "Default/stock profile photo detected",
+                        'severity': 'high'
+                    })
             
-            # Check for AI-generated images (simplified)
-            if self.check_ai_image(img):
-                results['image_authenticity'] = "Possible AI-generated profile photo"
-                results['score'] += 25
+                # Check for AI-generated images (simplified)
+                if self.check_ai_image(img):
+                    results['image_authenticity'] = "Possible AI-generated profile photo"
+                    results['score'] += 25
+                    results['indicators'].append({
+                        'indicator': "AI-generated profile photo detected",
+                        'severity': 'high'
+                    })
+                    results['key_indicators'].append({
+                        'indicator': "AI-generated profile photo",
+                        'severity': 'high'
+                    })
+                
+        except Exception as e:
+            results['image_authenticity'] = f"Image analysis failed: {str(e)}"
+
+    def check_ai_image(self, img):
+        """Simplified check for AI-generated images"""
+        # In a real implementation, this would use an AI model
+        # Here we simulate with a random chance
+        return random.random() < 0.3  # 30% chance of being AI
+
+    def simulate_reverse_image_search(self, results, is_fake_account):
+        """Simulate reverse image search results"""
+        if is_fake_account:
+            # Fake accounts are more likely to have matching images
+            if random.random() < 0.7:
+                matches = random.randint(1, 10)
+                results['reverse_image_match'] = f"Found {matches} matching images online"
+                results['score'] += 20
                 results['indicators'].append({
-                    'indicator': "AI-generated profile photo detected",
+                    'indicator': f"Profile photo matches {matches} other online images",
                     'severity': 'high'
                 })
                 results['key_indicators'].append({
-                    'indicator': "AI-generated profile photo",
+                    'indicator': "Profile photo found on multiple accounts",
                     'severity': 'high'
                 })
-                
-    except Exception as e:
-        results['image_authenticity'] = f"Image analysis failed: {str(e)}"
-
-def check_ai_image(self, img):
-    """Simplified check for AI-generated images"""
-    # In a real implementation, this would use an AI model
-    # Here we simulate with a random chance
-    return random.random() < 0.3  # 30% chance of being AI
-
-def simulate_reverse_image_search(self, results, is_fake_account):
-    """Simulate reverse image search results"""
-    if is_fake_account:
-        # Fake accounts are more likely to have matching images
-        if random.random() < 0.7:
-            matches = random.randint(1, 10)
-            results['reverse_image_match'] = f"Found {matches} matching images online"
-            results['score'] += 20
-            results['indicators'].append({
-                'indicator': f"Profile photo matches {matches} other online images",
-                'severity': 'high'
-            })
-            results['key_indicators'].append({
-                'indicator': "Profile photo found on multiple accounts",
-                'severity': 'high'
-            })
+            else:
+                results['reverse_image_match'] = "No matches found"
         else:
-            results['reverse_image_match'] = "No matches found"
-    else:
-        # Genuine accounts might have some matches (profile pics reused)
-        if random.random() < 0.2:
-            matches = random.randint(1, 3)
-            results['reverse_image_match'] = f"Found {matches} matching images online"
+            # Genuine accounts might have some matches (profile pics reused)
+            if random.random() < 0.2:
+                matches = random.randint(1, 3)
+                results['reverse_image_match'] = f"Found {matches} matching images online"
+                results['score'] += 10
+                results['indicators'].append({
+                    'indicator': f"Profile photo matches {matches} other online images",
+                    'severity': 'medium'
+                })
+            else:
+                results['reverse_image_match'] = "No matches found"
+                results['positive_indicators'].append("Unique profile photo")
+
+    def analyze_username(self, results, username):
+        """Analyze username for suspicious patterns"""
+        suspicious_patterns = self.fake_indicators.get('suspicious_username_patterns', [])
+    
+        for pattern in suspicious_patterns:
+            if re.search(pattern, username, re.IGNORECASE):
+                results['score'] += 15
+                results['indicators'].append({
+                    'indicator': f"Suspicious username pattern: '{pattern}'",
+                    'severity': 'medium'
+                })
+                break
+    
+        # Check for random character sequences
+        if re.search(r'[a-z0-9]{8,}', username) and not re.search(r'[aeiouy]{2,}', username.lower()):
             results['score'] += 10
             results['indicators'].append({
-                'indicator': f"Profile photo matches {matches} other online images",
+                'indicator': "Username appears randomly generated",
                 'severity': 'medium'
             })
-        else:
-            results['reverse_image_match'] = "No matches found"
-            results['positive_indicators'].append("Unique profile photo")
+    
+        # Check for numbers at the end (common in fake accounts)
+        if re.search(r'\d{3,}$', username):
+            results['score'] += 5
+            results['indicators'].append({
+                'indicator': "Username ends with multiple numbers",
+                'severity': 'low'
+            })
 
-def analyze_username(self, results, username):
-    """Analyze username for suspicious patterns"""
-    suspicious_patterns = self.fake_indicators.get('suspicious_username_patterns', [])
+    def analyze_instagram_bio(self, results, bio, full_name):
+        """Analyze Instagram bio for suspicious content"""
+        if not bio.strip():
+            results['score'] += 5
+            results['indicators'].append({
+                'indicator': "Empty bio",
+                'severity': 'low'
+            })
+    
+        # Check for spammy keywords
+        spam_keywords = self.fake_indicators.get('spam_keywords', [])
+        for keyword in spam_keywords:
+            if keyword.lower() in bio.lower():
+                results['score'] += 10
+                results['indicators'].append({
+                    'indicator': f"Bio contains suspicious keyword: '{keyword}'",
+                    'severity': 'medium'
+                })
+                break
     
-    for pattern in suspicious_patterns:
-        if re.search(pattern, username, re.IGNORECASE):
+        # Check for link shorteners
+        if re.search(r'(bit\.ly|goo\.gl|tinyurl|ow\.ly)', bio):
             results['score'] += 15
             results['indicators'].append({
-                'indicator': f"Suspicious username pattern: '{pattern}'",
-                'severity': 'medium'
+                'indicator': "Bio contains URL shortener",
+                'severity': 'high'
             })
-            break
-    
-    # Check for random character sequences
-    if re.search(r'[a-z0-9]{8,}', username) and not re.search(r'[aeiouy]{2,}', username.lower()):
-        results['score'] += 10
-        results['indicators'].append({
-            'indicator': "Username appears randomly generated",
-            'severity': 'medium'
-        })
-    
-    # Check for numbers at the end (common in fake accounts)
-    if re.search(r'\d{3,}$', username):
-        results['score'] += 5
-        results['indicators'].append({
-            'indicator': "Username ends with multiple numbers",
-            'severity': 'low'
-        })
-
-def analyze_instagram_bio(self, results, bio, full_name):
-    """Analyze Instagram bio for suspicious content"""
-    if not bio.strip():
-        results['score'] += 5
-        results['indicators'].append({
-            'indicator': "Empty bio",
-            'severity': 'low'
-        })
-    
-    # Check for spammy keywords
-    spam_keywords = self.fake_indicators.get('spam_keywords', [])
-    for keyword in spam_keywords:
-        if keyword.lower() in bio.lower():
-            results['score'] += 10
+    
+        # Check name consistency
+        if full_name and len(full_name.split()) < 2:
+            results['score'] += 5
             results['indicators'].append({
-                'indicator': f"Bio contains suspicious keyword: '{keyword}'",
-                'severity': 'medium'
+                'indicator': "Full name appears incomplete",
+                'severity': 'low'
             })
-            break
-    
-    # Check for link shorteners
-    if re.search(r'(bit\.ly|goo\.gl|tinyurl|ow\.ly)', bio):
-        results['score'] += 15
-        results['indicators'].append({
-            'indicator': "Bio contains URL shortener",
-            'severity': 'high'
-        })
-    
-    # Check name consistency
-    if full_name and len(full_name.split()) < 2:
-        results['score'] += 5
-        results['indicators'].append({
-            'indicator': "Full name appears incomplete",
-            'severity': 'low'
-        })
 
-def calculate_final_score(self, results):
-    """Calculate final risk score with adjustments"""
-    base_score = results.get('score', 0)
+    def calculate_final_score(self, results):
+        """Calculate final risk score with adjustments"""
+        base_score = results.get('score', 0)
     
-    # Cap the score at 100
-    final_score = min(100, base_score)
+        # Cap the score at 100
+        final_score = min(100, base_score)
     
-    # Apply some randomness to simulate real-world uncertainty
-    final_score += random.randint(-5, 5)
-    final_score = max(0, min(100, final_score))
+        # Apply some randomness to simulate real-world uncertainty
+        final_score += random.randint(-5, 5)
+        final_score = max(0, min(100, final_score))
     
-    return final_score
+        return final_score
 
-def determine_verdict(self, results):
-    """Determine final verdict based on score"""
-    score = results['score']
-    
-    if score >= 70:
-        results['risk_level'] = 'High Risk'
-        results['recommendation'] = 'Very likely fake - avoid interaction'
-    elif score >= 50:
-        results['risk_level'] = 'Medium Risk'
-        results['recommendation'] = 'Shows multiple fake indicators - proceed with caution'
-    elif score >= 30:
-        results['risk_level'] = 'Low Risk'
-        results['recommendation'] = 'Some suspicious elements - verify before trusting'
-    else:
-        results['risk_level'] = 'Very Low Risk'
-        results['recommendation'] = 'Appears genuine - normal precautions recommended'
-    
-    # Select key indicators (top 3-5 most severe)
-    high_indicators = [i for i in results['indicators'] if i['severity'] == 'high']
-    medium_indicators = [i for i in results['indicators'] if i['severity'] == 'medium']
-    low_indicators = [i for i in results['indicators'] if i['severity'] == 'low']
-    
-    results['key_indicators'] = (
-        high_indicators[:2] + 
-        medium_indicators[:2] + 
-        low_indicators[:1]
-    )[:5]  # Ensure max 5 indicators
+    def determine_verdict(self, results):
+        """Determine final verdict based on score"""
+        score = results['score']
+    
+        if score >= 70:
+            results['risk_level'] = 'High Risk'
+            results['recommendation'] = 'Very likely fake - avoid interaction'
+        elif score >= 50:
+            results['risk_level'] = 'Medium Risk'
+            results['recommendation'] = 'Shows multiple fake indicators - proceed with caution'
+        elif score >= 30:
+            results['risk_level'] = 'Low Risk'
+            results['recommendation'] = 'Some suspicious elements - verify before trusting'
+        else:
+            results['risk_level'] = 'Very Low Risk'
+            results['recommendation'] = 'Appears genuine - normal precautions recommended'
+    
+        # Select key indicators (top 3-5 most severe)
+        high_indicators = [i for i in results['indicators'] if i['severity'] == 'high']
+        medium_indicators = [i for i in results['indicators'] if i['severity'] == 'medium']
+        low_indicators = [i for i in results['indicators'] if i['severity'] == 'low']
+    
+        results['key_indicators'] = (
+            high_indicators[:2] + 
+            medium_indicators[:2] + 
+            low_indicators[:1]
+        )[:5]  # Ensure max 5 indicators
 
-def detect_platform(self, url, platform):
-    """Detect social media platform from URL"""
-    if platform != 'auto':
-        return platform.lower()
+    def detect_platform(self, url, platform):
+        """Detect social media platform from URL"""
+        if platform != 'auto':
+            return platform.lower()
     
-    for platform_name, pattern in self.platform_patterns.items():
-        if re.search(pattern, url, re.IGNORECASE):
-            return platform_name
+        for platform_name, pattern in self.platform_patterns.items():
+            if re.search(pattern, url, re.IGNORECASE):
+                return platform_name
     
-    return 'other'
+        return 'other'
 
-def format_timedelta(self, td):
-    """Format timedelta into human-readable string"""
-    days = td.days
-    years, days = divmod(days, 365)
-    months, days = divmod(days, 30)
-    
-    parts = []
-    if years > 0:
-        parts.append(f"{years} year{'s' if years > 1 else ''}")
-    if months > 0:
-        parts.append(f"{months} month{'s' if months > 1 else ''}")
-    if days > 0 and years == 0:  # Only show days if < 1 year
-        parts.append(f"{days} day{'s' if days > 1 else ''}")
-    
-    if not parts:
-        return "less than 1 day"
-    return ', '.join(parts)
\ No newline at end of file
+    def format_timedelta(self, td):
+        """Format timedelta into human-readable string"""
+        days = td.days
+        years, days = divmod(days, 365)
+        months, days = divmod(days, 30)
+    
+        parts = []
+        if years > 0:
+            parts.append(f"{years} year{'s' if years > 1 else ''}")
+        if months > 0:
+            parts.append(f"{months} month{'s' if months > 1 else ''}")
+        if days > 0 and years == 0:  # Only show days if < 1 year
+            parts.append(f"{days} day{'s' if days > 1 else ''}")
+    
+        if not parts:
+            return "less than 1 day"
+        return ', '.join(parts)
\ No newline at end of file
@@ -0,0 +1,79 @@
+import argparse
+
+import joblib
+import numpy as np
+
+from sklearn.linear_model import SGDClassifier
+from sklearn.preprocessing import StandardScaler
+
+from features import model_frame, username_feature_names, USERNAME_BUCKETS
+from pipeline import build_pipeline
+from artifact import save_artifact
+from ingest import read_profiles
+
+# Out-of-core counterpart of model.py: the CSV is only ever read one chunk at a
+# time, so peak memory depends on --chunksize and not on the size of the file.
+
+parser = argparse.ArgumentParser(description="Train the fake profile model chunk by chunk")
+parser.add_argument('csv', nargs='?', default='fake_profiles.csv')
+parser.add_argument('--chunksize', type=int, default=100000, help="rows per chunk")
+parser.add_argument('--epochs', type=int, default=5, help="passes over the file")
+parser.add_argument('--holdout-every', type=int, default=5,
+                    help="every Nth row is held out for evaluation (default: 20%%)")
+args = parser.parse_args()
+
+
+def read_chunks(path):
+    """Yield (features, labels, holdout_mask) for every chunk of the CSV"""
+    offset = 0
+    for chunk in read_profiles(path, chunksize=args.chunksize):
+        labels = chunk.pop('label').to_numpy()
+        features = model_frame(chunk, [column for column in chunk.columns if column != 'username'])
+
+        row_ids = np.arange(offset, offset + len(chunk))
+        offset += len(chunk)
+
+        holdout = row_ids % args.holdout_every == 0
+        yield features, labels, holdout
+
+
+# Step 1: Fit the scaler incrementally and collect the label set
+scaler = StandardScaler()
+classes = set()
+feature_names = None
+for features, labels, holdout in read_chunks(args.csv):
+    feature_names = list(features.columns)
+    if (~holdout).any():
+        scaler.partial_fit(features[~holdout])
+    classes.update(labels)
+classes = np.array(sorted(classes))
+print(f"✅ Scaler fitted on {int(scaler.n_samples_seen_)} rows, features: {feature_names}")
+
+joblib.dump(scaler, 'scaler.pkl')
+print("✅ Scaler saved as scaler.pkl")
+
+# Step 2: Train logistic regression with SGD, one chunk at a time
+model = SGDClassifier(loss='log_loss', random_state=42)
+for epoch in range(args.epochs):
+    for features, labels, holdout in read_chunks(args.csv):
+        if (~holdout).any():
+            model.partial_fit(scaler.transform(features[~holdout]), labels[~holdout], classes=classes)
+
+    # Step 3: Evaluate on the held-out rows, again chunk by chunk
+    correct = total = 0
+    for features, labels, holdout in read_chunks(args.csv):
+        if holdout.any():
+            y_pred = model.predict(scaler.transform(features[holdout]))
+            correct += int((y_pred == labels[holdout]).sum())
+            total += int(holdout.sum())
+    print(f"Epoch {epoch + 1}: holdout accuracy {correct / max(total, 1):.4f} ({total} rows)")
+
+# Step 4: Save the model and the fused inference pipeline
+joblib.dump(model, 'best_model.pkl')
+print("\n✅ Best model saved: SGD Logistic Regression (best_model.pkl)")
+
+numeric_columns = feature_names[len(username_feature_names()):]
+pipeline = build_pipeline(numeric_columns, scaler, model, username_buckets=USERNAME_BUCKETS)
+joblib.dump(pipeline, 'pipeline.pkl')
+save_artifact(pipeline, 'pipeline.artifact')
+print("✅ Inference pipeline saved as pipeline.pkl and pipeline.artifact")
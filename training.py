@@ -0,0 +1,117 @@
+import os
+import time
+
+import joblib
+import numpy as np
+from joblib import Parallel, delayed
+
+
+def fit_model(name, model, X_train, y_train):
+    """Fit one candidate and report how long it took"""
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    return name, model, time.perf_counter() - start
+
+
+def train_models(models, X_train, y_train, n_jobs=1):
+    """Fit every candidate model, across a process pool when n_jobs != 1
+
+    Returns {name: (fitted_model, wall_seconds)} in the original order.
+    """
+    if n_jobs == 1:
+        results = [fit_model(name, model, X_train, y_train) for name, model in models.items()]
+    else:
+        # loky worker processes; the training arrays are memory-mapped to the
+        # workers instead of being copied once per candidate
+        results = Parallel(n_jobs=n_jobs, backend='loky')(
+            delayed(fit_model)(name, model, X_train, y_train)
+            for name, model in models.items()
+        )
+    return {name: (model, seconds) for name, model, seconds in results}
+
+
+def measure_latency(model, X, repeats=5, single_rows=200):
+    """Per-row predict latency in microseconds, one row at a time and as one batch
+
+    X is a matrix, or a DataFrame of raw profiles for a fused pipeline. Both
+    figures are the best of several runs to filter out scheduler noise.
+    """
+    if not hasattr(X, 'columns'):
+        X = np.asarray(X)
+    rows = [X[i:i + 1] for i in range(min(single_rows, len(X)))]
+
+    single = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for row in rows:
+            model.predict(row)
+        single = min(single, (time.perf_counter() - start) / len(rows))
+
+    batch = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.predict(X)
+        batch = min(batch, (time.perf_counter() - start) / len(X))
+
+    return {'single_row_us': single * 1e6, 'batch_row_us': batch * 1e6}
+
+
+def select_model(accuracies, latencies, objective='accuracy', latency_budget_us=None):
+    """Pick the best candidate name given accuracies and measure_latency results
+
+    objective='accuracy' keeps the most accurate model (ties go to the faster
+    one); 'accuracy_per_us' maximises accuracy per microsecond of single-row
+    latency. With latency_budget_us only models whose single-row latency fits
+    the budget are eligible; if none fit, the fastest model is returned.
+    """
+    candidates = list(accuracies)
+    if latency_budget_us is not None:
+        within = [name for name in candidates if latencies[name]['single_row_us'] <= latency_budget_us]
+        if not within:
+            return min(candidates, key=lambda name: latencies[name]['single_row_us'])
+        candidates = within
+
+    if objective == 'accuracy_per_us':
+        return max(candidates, key=lambda name: accuracies[name] / latencies[name]['single_row_us'])
+    return max(candidates, key=lambda name: (accuracies[name], -latencies[name]['single_row_us']))
+
+
+def rescale_linear_model(model, old_mean, old_scale, new_mean, new_scale):
+    """Re-express a linear model's weights in the units of updated scaler statistics
+
+    w.(x - m_old)/s_old + b equals w'.(x - m_new)/s_new + b' for
+    w' = w * s_new/s_old and b' = b + w.(m_new - m_old)/s_old, so the model's
+    decisions are unchanged by the scaler update itself.
+    """
+    coef = model.coef_
+    model.intercept_ = model.intercept_ + coef @ ((new_mean - old_mean) / old_scale)
+    model.coef_ = coef * (new_scale / old_scale)
+
+
+def update_model(model, scaler, X, y):
+    """Incrementally update a partial_fit linear model and its scaler from a labelled batch
+
+    The scaler statistics absorb the batch first and the weights are rescaled
+    to match, then the model takes one partial_fit pass over the batch.
+    Returns the accuracy on the batch measured before the update
+    (test-then-train), an unbiased estimate for data the model has not seen.
+    """
+    if not hasattr(model, 'partial_fit') or not hasattr(model, 'coef_'):
+        raise ValueError(f"{type(model).__name__} cannot be updated incrementally; "
+                         "train a linear partial_fit model with train_streaming.py first")
+    y = np.asarray(y)
+    accuracy = float(np.mean(model.predict(scaler.transform(X)) == y))
+
+    old_mean, old_scale = scaler.mean_.copy(), scaler.scale_.copy()
+    scaler.partial_fit(X)
+    rescale_linear_model(model, old_mean, old_scale, scaler.mean_, scaler.scale_)
+
+    model.partial_fit(scaler.transform(X), y)
+    return accuracy
+
+
+def dump_atomic(obj, path):
+    """joblib.dump to a temporary file, then rename it over path"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    joblib.dump(obj, tmp_path)
+    os.replace(tmp_path, path)
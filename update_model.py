@@ -0,0 +1,61 @@
+import argparse
+
+import joblib
+
+from features import model_frame, username_feature_names, USERNAME_BUCKETS
+from pipeline import build_pipeline
+from artifact import save_artifact
+from ingest import read_profiles
+from training import update_model, dump_atomic
+
+# Online counterpart of train_streaming.py: instead of retraining from
+# scratch, fold newly labelled profiles (e.g. moderator verdicts) into the
+# current SGD model and scaler. Every checkpoint is written atomically, so a
+# running app.py picks up the new weights without ever seeing a partial model.
+
+parser = argparse.ArgumentParser(description="Update the fake profile model with newly labelled profiles")
+parser.add_argument('csv', nargs='+', help="CSV files of newly labelled profiles")
+parser.add_argument('--model', default='best_model.pkl', help="partial_fit model to update")
+parser.add_argument('--scaler', default='scaler.pkl', help="scaler the model was trained with")
+parser.add_argument('--chunksize', type=int, default=100000, help="rows per update step")
+parser.add_argument('--checkpoint-every', type=int, default=1,
+                    help="write the checkpoint after every N update steps")
+args = parser.parse_args()
+
+
+def checkpoint():
+    """Publish the updated model: the pickles first, the served artifact last"""
+    dump_atomic(model, args.model)
+    dump_atomic(scaler, args.scaler)
+    pipeline = build_pipeline(numeric_columns, scaler, model, username_buckets=USERNAME_BUCKETS)
+    dump_atomic(pipeline, 'pipeline.pkl')
+    return save_artifact(pipeline, 'pipeline.artifact')
+
+
+# Step 1: Load the current model and scaler
+model = joblib.load(args.model)
+scaler = joblib.load(args.scaler)
+numeric_columns = list(scaler.feature_names_in_[len(username_feature_names()):])
+print(f"✅ Loaded {type(model).__name__} trained on {int(scaler.n_samples_seen_)} rows")
+
+# Step 2: One update step per chunk of new rows, checkpointing as we go
+steps = rows = correct = 0
+for path in args.csv:
+    for chunk in read_profiles(path, chunksize=args.chunksize):
+        if chunk.empty:
+            continue
+        labels = chunk.pop('label').to_numpy()
+        accuracy = update_model(model, scaler, model_frame(chunk, numeric_columns), labels)
+
+        steps += 1
+        rows += len(chunk)
+        correct += accuracy * len(chunk)
+        print(f"Step {steps}: {len(chunk)} rows from {path}, accuracy before update {accuracy:.4f}")
+        if steps % args.checkpoint_every == 0:
+            print(f"✅ Checkpoint {checkpoint()} published")
+
+# Step 3: Final checkpoint for any steps since the last one
+if steps % args.checkpoint_every:
+    print(f"✅ Checkpoint {checkpoint()} published")
+print(f"\nUpdated on {rows} new rows, accuracy before update {correct / max(rows, 1):.4f}; "
+      f"scaler has now seen {int(scaler.n_samples_seen_)} rows")
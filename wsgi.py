@@ -0,0 +1,11 @@
+# Production entry point for the prediction service. app.py's __main__ block
+# runs Flask's single-threaded development server with the debugger and
+# reloader; serve this module with a prefork WSGI server instead:
+#
+#     pip install gunicorn
+#     gunicorn -c gunicorn.conf.py wsgi:application
+#
+# gunicorn.conf.py imports this module (and so loads the model) once in the
+# master process before forking, so every worker shares the model's memory
+# copy-on-write instead of loading its own copy.
+from app import app as application